@@ -1,55 +1,141 @@
 import sqlite3
 import uuid
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import atexit
+import threading
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+EVENTS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS events (
+        id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        start_time INTEGER NOT NULL,
+        end_time INTEGER NOT NULL,
+        category TEXT DEFAULT 'WORK',
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) WITHOUT ROWID
+"""
+
+
+def _to_epoch(value: str) -> int:
+    """Convert a local 'YYYY-MM-DD HH:MM:SS' string to Unix epoch seconds."""
+    return int(datetime.strptime(value, TIME_FORMAT).timestamp())
+
+
+def _from_epoch(value: int) -> str:
+    """Convert Unix epoch seconds back to a local 'YYYY-MM-DD HH:MM:SS' string."""
+    return datetime.fromtimestamp(value).strftime(TIME_FORMAT)
+
+
+@lru_cache(maxsize=512)
+def _display_time(value: int) -> str:
+    """Epoch seconds -> short clock label like '9:30 AM' (events re-render on every day switch)."""
+    return datetime.fromtimestamp(value).strftime("%I:%M %p").lstrip("0")
+
 
 class CalendarManager:
     """Manages calendar events using a local SQLite database."""
     
     def __init__(self, db_path: str = "data/calendar.db"):
         self.db_path = db_path
+        self._lock = threading.Lock()
         self._init_db()
+        atexit.register(self.close)
         
     def _init_db(self):
-        """Initialize the database and create table if not exists."""
+        """Open the shared connection and create table if not exists."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS events (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    start_time TIMESTAMP NOT NULL,
-                    end_time TIMESTAMP NOT NULL,
-                    category TEXT DEFAULT 'WORK',
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.commit()
+        # One long-lived connection for the lifetime of the manager; callers
+        # from the GUI and executor threads are serialized through self._lock.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-64000")
+        
+        self._migrate_events()
+        self._conn.execute(EVENTS_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_start ON events(start_time)")
+
+    def _migrate_events(self):
+        """Rebuild a legacy events table (TEXT timestamps or implicit rowid)."""
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='events'"
+        ).fetchone()
+        if row is None:
+            return
+        
+        columns = {r["name"]: r["type"] for r in self._conn.execute("PRAGMA table_info(events)")}
+        text_times = columns.get("start_time", "").upper() != "INTEGER"
+        if not text_times and "WITHOUT ROWID" in row["sql"].upper():
+            return
+        
+        convert = _to_epoch if text_times else int
+        print("[CalendarManager] Migrating events table to current schema...")
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("ALTER TABLE events RENAME TO events_legacy")
+            self._conn.execute(EVENTS_SCHEMA)
+            rows = self._conn.execute("""
+                SELECT id, title, start_time, end_time, category, description, created_at
+                FROM events_legacy
+            """).fetchall()
+            self._conn.executemany("""
+                INSERT INTO events (id, title, start_time, end_time, category, description, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (r["id"], r["title"], convert(r["start_time"]), convert(r["end_time"]),
+                 r["category"], r["description"], r["created_at"])
+                for r in rows
+            ])
+            self._conn.execute("DROP TABLE events_legacy")
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
             
     def get_events(self, date_str: str) -> List[Dict]:
         """
         Retrieve events for a specific date (YYYY-MM-DD).
         """
         try:
-            # Create range for the entire day
-            start_of_day = f"{date_str} 00:00:00"
-            end_of_day = f"{date_str} 23:59:59"
+            # Half-open range [midnight, next midnight) for the entire day
+            day = datetime.strptime(date_str, "%Y-%m-%d")
+            start_of_day = int(day.timestamp())
+            next_day = int((day + timedelta(days=1)).timestamp())
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM events 
-                    WHERE start_time BETWEEN ? AND ? 
+            with self._lock:
+                cursor = self._conn.execute("""
+                    SELECT id, title, start_time, end_time, category, description, created_at
+                    FROM events 
+                    WHERE start_time >= ? AND start_time < ? 
                     ORDER BY start_time ASC
-                """, (start_of_day, end_of_day))
+                """, (start_of_day, next_day))
                 
                 rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+            
+            events = []
+            for row in rows:
+                event = dict(row)
+                event["_time_str"] = _display_time(event["start_time"])
+                event["start_time"] = _from_epoch(event["start_time"])
+                event["end_time"] = _from_epoch(event["end_time"])
+                events.append(event)
+            return events
         except Exception as e:
             print(f"Error loading events: {e}")
             return []
@@ -59,35 +145,55 @@ class CalendarManager:
         Add a new event.
         Time format: 'YYYY-MM-DD HH:MM:SS'
         """
-        event_id = str(uuid.uuid4())
+        events = self.add_events_bulk([(title, start_time, end_time, category, description)])
+        return events[0] if events else None
+
+    def add_events_bulk(self, events: List[Tuple]) -> List[Dict]:
+        """
+        Add many events in a single transaction.
+        Each entry is (title, start_time, end_time[, category[, description]]).
+        """
+        created = []
+        for entry in events:
+            title, start_time, end_time, *rest = entry
+            category = rest[0] if len(rest) > 0 else "WORK"
+            description = rest[1] if len(rest) > 1 else ""
+            created.append({
+                "id": str(uuid.uuid4()),
+                "title": title,
+                "start_time": start_time,
+                "end_time": end_time,
+                "category": category,
+                "description": description
+            })
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO events (id, title, start_time, end_time, category, description) 
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (event_id, title, start_time, end_time, category, description))
-                conn.commit()
-                
-                return {
-                    "id": event_id,
-                    "title": title,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "category": category,
-                    "description": description
-                }
+            rows = [
+                (e["id"], e["title"], _to_epoch(e["start_time"]), _to_epoch(e["end_time"]),
+                 e["category"], e["description"])
+                for e in created
+            ]
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany("""
+                        INSERT INTO events (id, title, start_time, end_time, category, description) 
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """, rows)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            return created
         except Exception as e:
-            print(f"Error adding event: {e}")
-            return None
+            print(f"Error adding events: {e}")
+            return []
 
     def delete_event(self, event_id: str):
         """Delete an event by ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
-                conn.commit()
+            with self._lock:
+                self._conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
         except Exception as e:
             print(f"Error deleting event: {e}")
 
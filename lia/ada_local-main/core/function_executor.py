@@ -3,31 +3,83 @@ Function Executor - Executes Gemma-routed functions with actual backend calls.
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import atexit
+import heapq
+import importlib
+import re
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import time
 
 
-@dataclass
+# Duration/time patterns, compiled once at import
+_DURATION_PATS = [
+    (re.compile(r'(\d+)\s*h(?:our)?s?'), 3600),
+    (re.compile(r'(\d+)\s*m(?:in(?:ute)?s?)?'), 60),
+    (re.compile(r'(\d+)\s*s(?:ec(?:ond)?s?)?'), 1),
+]
+_NUM_RE = re.compile(r'\d+')
+_TIME_RE = re.compile(r'(\d{1,2}):?(\d{2})?\s*(am|pm)?')
+
+# Day name -> weekday() index
+_DOW = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6,
+}
+_DOW_RE = re.compile(f"({'|'.join(_DOW)})")
+_ONE_DAY = timedelta(days=1)
+
+# Named light colors -> (hue, saturation, value)
+_COLOR_HSV = {
+    "red": (0, 100, 100), "orange": (30, 100, 100), "yellow": (60, 100, 100),
+    "green": (120, 100, 100), "cyan": (180, 100, 100), "blue": (240, 100, 100),
+    "purple": (270, 100, 100), "pink": (300, 100, 100), "white": (0, 0, 100),
+    "warm": (30, 80, 100), "warm white": (30, 80, 100), "cool white": (0, 0, 100),
+    "soft white": (30, 60, 100), "daylight": (0, 0, 100),
+    "candle light": (30, 100, 50), "amber": (30, 100, 100), "magenta": (300, 100, 100),
+}
+
+
+def _ok(message: str, data: Any = None) -> Dict[str, Any]:
+    """Build a successful execute() result."""
+    return {"success": True, "message": message, "data": data}
+
+
+def _err(message: str) -> Dict[str, Any]:
+    """Build a failed execute() result."""
+    return {"success": False, "message": message, "data": None}
+
+
+@dataclass(slots=True)
 class ActiveTimer:
     """Represents an active countdown timer."""
     label: str
     duration_seconds: int
     start_time: float
+    expiry_time: float = field(init=False)
+    
+    def __post_init__(self):
+        self.expiry_time = self.start_time + self.duration_seconds
     
     @property
     def remaining_seconds(self) -> int:
-        elapsed = time.time() - self.start_time
-        return max(0, int(self.duration_seconds - elapsed))
+        return self.remaining_with_now(time.time())
     
     @property
     def is_expired(self) -> bool:
-        return self.remaining_seconds <= 0
+        return self.is_expired_with_now(time.time())
+    
+    def remaining_with_now(self, now: float) -> int:
+        return max(0, int(self.expiry_time - now))
     
-    def format_remaining(self) -> str:
-        secs = self.remaining_seconds
+    def is_expired_with_now(self, now: float) -> bool:
+        return now >= self.expiry_time
+    
+    def format_remaining(self, now: Optional[float] = None) -> str:
+        secs = self.remaining_with_now(time.time() if now is None else now)
         mins, secs = divmod(secs, 60)
         hours, mins = divmod(mins, 60)
         if hours:
@@ -37,55 +89,158 @@ class ActiveTimer:
         return f"{secs}s"
 
 
+class TimerWheel:
+    """
+    Hashed timer wheel keyed by expiry time.
+    
+    Timers are grouped into buckets of 2**shift seconds. Advancing the wheel
+    drops every bucket that lies fully in the past without touching its
+    timers individually; only the current bucket is checked per timer.
+    """
+    
+    def __init__(self, shift: int = 4):
+        self.shift = shift
+        self._buckets: Dict[int, Dict[str, ActiveTimer]] = {}
+        self._slots: List[int] = []  # min-heap of occupied bucket slots
+        self._slot_of: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._slot_of)
+    
+    def _slot(self, expiry: float) -> int:
+        return int(expiry) >> self.shift
+    
+    def add(self, timer: ActiveTimer):
+        """Insert a timer, replacing any existing timer with the same label."""
+        self.remove(timer.label)
+        slot = self._slot(timer.expiry_time)
+        bucket = self._buckets.get(slot)
+        if bucket is None:
+            bucket = self._buckets[slot] = {}
+            heapq.heappush(self._slots, slot)
+        bucket[timer.label] = timer
+        self._slot_of[timer.label] = slot
+    
+    def remove(self, label: str):
+        """Remove a timer by label if present."""
+        slot = self._slot_of.pop(label, None)
+        if slot is None:
+            return
+        bucket = self._buckets[slot]
+        del bucket[label]
+        if not bucket:
+            # Empty slot stays in the heap and is discarded lazily in advance()
+            del self._buckets[slot]
+    
+    def advance(self, now: float) -> List[ActiveTimer]:
+        """Evict expired timers and return the live ones, bucket by bucket."""
+        current = self._slot(now)
+        while self._slots and self._slots[0] <= current:
+            slot = self._slots[0]
+            bucket = self._buckets.get(slot)
+            if bucket is None:
+                heapq.heappop(self._slots)
+                continue
+            if slot < current:
+                heapq.heappop(self._slots)
+                del self._buckets[slot]
+                for label in bucket:
+                    del self._slot_of[label]
+                continue
+            # Current bucket straddles 'now' - keep only its unexpired timers
+            survivors = {l: t for l, t in bucket.items() if not t.is_expired_with_now(now)}
+            if len(survivors) != len(bucket):
+                for label in bucket.keys() - survivors.keys():
+                    del self._slot_of[label]
+                if survivors:
+                    self._buckets[slot] = survivors
+                else:
+                    heapq.heappop(self._slots)
+                    del self._buckets[slot]
+            break
+        
+        live = []
+        for slot in sorted(self._buckets):
+            live.extend(self._buckets[slot].values())
+        return live
+
+
+class _LazyManager:
+    """Descriptor that imports a module-level manager instance on first access."""
+    
+    def __init__(self, module: str, attr: str, label: str):
+        self.module = module
+        self.attr = attr
+        self.label = label
+    
+    def __set_name__(self, owner, name):
+        self.slot = f"_{name}"
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.slot]
+        except KeyError:
+            pass
+        try:
+            value = getattr(importlib.import_module(self.module), self.attr)
+        except Exception as e:
+            # Remember the failure so a broken backend is only reported once
+            print(f"[FunctionExecutor] {self.label} init failed: {e}")
+            value = None
+        obj.__dict__[self.slot] = value
+        return value
+    
+    def __set__(self, obj, value):
+        obj.__dict__[self.slot] = value
+
+
 class FunctionExecutor:
     """Central executor for all Gemma-routed functions."""
     
+    INFO_CACHE_TTL = 5  # seconds
+    
+    # Shared manager instances, imported on first use
+    task_manager = _LazyManager("core.tasks", "task_manager", "TaskManager")
+    calendar_manager = _LazyManager("core.calendar_manager", "calendar_manager", "CalendarManager")
+    kasa_manager = _LazyManager("core.kasa_control", "kasa_manager", "KasaManager")
+    weather_manager = _LazyManager("core.weather", "weather_manager", "WeatherManager")
+    news_manager = _LazyManager("core.news", "news_manager", "NewsManager")
+    
     def __init__(self):
-        self.task_manager = None
-        self.calendar_manager = None
-        self.kasa_manager = None
-        self.weather_manager = None
-        self.news_manager = None
-        
         # In-memory timer storage
-        self.active_timers: Dict[str, ActiveTimer] = {}
+        self.active_timers = TimerWheel()
         self._timer_lock = threading.Lock()
         
-        # Lazy load managers
-        self._init_managers()
-    
-    def _init_managers(self):
-        """Initialize manager references."""
-        try:
-            from core.tasks import TaskManager
-            self.task_manager = TaskManager()
-        except Exception as e:
-            print(f"[FunctionExecutor] TaskManager init failed: {e}")
+        # Lowercased alias index over kasa_manager.devices, rebuilt when the dict is replaced
+        self._alias_source = None
+        self._alias_index: List[tuple] = []
         
-        try:
-            from core.calendar_manager import CalendarManager
-            self.calendar_manager = CalendarManager()
-        except Exception as e:
-            print(f"[FunctionExecutor] CalendarManager init failed: {e}")
+        # Worker pool for fanning out manager I/O in _get_system_info
+        self._io_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="SystemInfo")
         
-        try:
-            from core.kasa_control import kasa_manager
-            self.kasa_manager = kasa_manager
-        except Exception as e:
-            print(f"[FunctionExecutor] KasaManager init failed: {e}")
+        # Short-lived results for slow system-info fetchers: key -> (time bucket, value)
+        self._info_cache: Dict[tuple, tuple] = {}
         
-        try:
-            from core.weather import WeatherManager
-            self.weather_manager = WeatherManager()
-        except Exception as e:
-            print(f"[FunctionExecutor] WeatherManager init failed: {e}")
+        # DuckDuckGo client, created on first search and reused afterwards
+        self._ddgs = None
+        
+        # Persistent event loop for async device control (started on first use)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        
+        # Function name -> handler
+        self._dispatch = {
+            "control_light": self._control_light,
+            "set_timer": self._set_timer,
+            "set_alarm": self._set_alarm,
+            "create_calendar_event": self._create_calendar_event,
+            "add_task": self._add_task,
+            "web_search": self._web_search,
+            "get_system_info": lambda params: self._get_system_info(),
+        }
         
-        try:
-            from core.news import NewsManager
-            self.news_manager = NewsManager()
-        except Exception as e:
-            print(f"[FunctionExecutor] NewsManager init failed: {e}")
-    
     def execute(self, func_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a function and return structured result.
@@ -98,34 +253,56 @@ class FunctionExecutor:
             }
         """
         try:
-            if func_name == "control_light":
-                return self._control_light(params)
-            elif func_name == "set_timer":
-                return self._set_timer(params)
-            elif func_name == "set_alarm":
-                return self._set_alarm(params)
-            elif func_name == "create_calendar_event":
-                return self._create_calendar_event(params)
-            elif func_name == "add_task":
-                return self._add_task(params)
-            elif func_name == "web_search":
-                return self._web_search(params)
-            elif func_name == "get_system_info":
-                return self._get_system_info()
-            else:
-                return {"success": False, "message": f"Unknown function: {func_name}", "data": None}
+            handler = self._dispatch.get(func_name)
+            if handler is None:
+                return _err(f"Unknown function: {func_name}")
+            return handler(params)
         except Exception as e:
-            return {"success": False, "message": f"Error: {str(e)}", "data": None}
+            return _err(f"Error: {str(e)}")
     
     # === Action Functions ===
     
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread if needed."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="FunctionExecutorLoop",
+                    daemon=True
+                ).start()
+            return self._loop
+    
     def _control_light(self, params: Dict) -> Dict:
-        """Control smart lights via Kasa. Wrapper for async execution."""
+        """Control smart lights via Kasa. Submits to the persistent event loop."""
+        future = asyncio.run_coroutine_threadsafe(self._async_control_light(params), self._get_loop())
         try:
-            return asyncio.run(self._async_control_light(params))
+            return future.result(timeout=30)
         except Exception as e:
+            future.cancel()
             print(f"[FunctionExecutor] Light control failed: {e}")
-            return {"success": False, "message": f"Light control failed: {e}", "data": None}
+            return _err(f"Light control failed: {e}")
+
+    def _match_devices(self, device_name_lower: str, devices: Dict) -> tuple:
+        """Return (ips, display names) of devices matching a lowercased name."""
+        if devices is not self._alias_source:
+            # discover_devices() assigns a fresh dict, so identity marks staleness
+            self._alias_index = [
+                (ip, info.get("alias", "").lower(), info.get("alias", ip))
+                for ip, info in devices.items()
+            ]
+            self._alias_source = devices
+        
+        if device_name_lower in ("all", "lights", "light", "everything"):
+            matches = self._alias_index
+        else:
+            # Fuzzy match
+            matches = [
+                entry for entry in self._alias_index
+                if device_name_lower in entry[1] or entry[1] in device_name_lower
+            ]
+        return [m[0] for m in matches], [m[2] for m in matches]
 
     async def _async_control_light(self, params: Dict) -> Dict:
         """Async implementation of light control."""
@@ -135,7 +312,7 @@ class FunctionExecutor:
         color = params.get("color")
         
         if not self.kasa_manager:
-            return {"success": False, "message": "Kasa manager not available", "data": None}
+            return _err("Kasa manager not available")
         
         # 1. Ensure we have a cache of devices (alias mapping)
         if not self.kasa_manager.devices:
@@ -145,26 +322,13 @@ class FunctionExecutor:
             
         devices = self.kasa_manager.devices
         if not devices:
-            return {"success": False, "message": "No smart devices found", "data": None}
+            return _err("No smart devices found")
         
         print(f"\n[FunctionExecutor] _control_light called with: {params}")
         
         # 2. Find Targets (IPs)
-        target_ips = []
-        target_names = []
         device_name_lower = device_name.lower()
-        
-        if device_name_lower in ("all", "lights", "light", "everything"):
-             for ip, info in devices.items():
-                 target_ips.append(ip)
-                 target_names.append(info.get("alias", ip))
-        else:
-            # Fuzzy match
-            for ip, info in devices.items():
-                alias = info.get("alias", "").lower()
-                if device_name_lower in alias or alias in device_name_lower:
-                    target_ips.append(ip)
-                    target_names.append(info.get("alias", ip))
+        target_ips, target_names = self._match_devices(device_name_lower, devices)
         
         print(f"[FunctionExecutor] Matched {len(target_ips)} devices: {target_names}")
         
@@ -175,36 +339,19 @@ class FunctionExecutor:
             devices = self.kasa_manager.devices
             
             # Retry match
-            target_ips = []
-            target_names = []
-            for ip, info in devices.items():
-                alias = info.get("alias", "").lower()
-                if device_name_lower in alias or alias in device_name_lower:
-                    target_ips.append(ip)
-                    target_names.append(info.get("alias", ip))
+            target_ips, target_names = self._match_devices(device_name_lower, devices)
             
             if not target_ips:
-                return {"success": False, "message": f"Device '{device_name}' not found", "data": None}
+                return _err(f"Device '{device_name}' not found")
 
-        # 3. Execute Actions
-        results = []
-        
-        for i, ip in enumerate(target_ips):
-            alias = target_names[i]
+        # 3. Execute Actions - each device is its own network round-trip, so run them concurrently
+        async def apply(ip: str, alias: str) -> Optional[str]:
             success = False
             action_desc = ""
             
             # Handle color parameter
             if action == "on" and color:
-                colors = {
-                    "red": (0, 100, 100), "orange": (30, 100, 100), "yellow": (60, 100, 100),
-                    "green": (120, 100, 100), "cyan": (180, 100, 100), "blue": (240, 100, 100),
-                    "purple": (270, 100, 100), "pink": (300, 100, 100), "white": (0, 0, 100),
-                    "warm": (30, 80, 100), "warm white": (30, 80, 100), "cool white": (0, 0, 100),
-                    "soft white": (30, 60, 100), "daylight": (0, 0, 100),
-                    "candle light": (30, 100, 50), "amber": (30, 100, 100), "magenta": (300, 100, 100),
-                }
-                target_hsv = colors.get(color.lower())
+                target_hsv = _COLOR_HSV.get(color.lower())
                 if target_hsv:
                     h, s, v = target_hsv
                     # PASS ONLY IP - Do not pass 'dev'
@@ -247,17 +394,26 @@ class FunctionExecutor:
             else:
                 action_desc = f"Unknown action {action} for"
             
-            if success:
-                results.append(f"{action_desc} {alias}")
+            return f"{action_desc} {alias}" if success else None
+        
+        outcomes = await asyncio.gather(
+            *(apply(ip, alias) for ip, alias in zip(target_ips, target_names)),
+            return_exceptions=True
+        )
+        results = []
+        for alias, outcome in zip(target_names, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"[FunctionExecutor] Light control failed for {alias}: {outcome}")
+            elif outcome:
+                results.append(outcome)
 
         if not results:
-            return {"success": False, "message": "Failed to control any devices", "data": None}
+            return _err("Failed to control any devices")
         
-        return {
-            "success": True, 
-            "message": ", ".join(results), 
-            "data": {"device": device_name, "action": action, "targets": target_names}
-        }
+        return _ok(
+            ", ".join(results),
+            {"device": device_name, "action": action, "targets": target_names}
+        )
 
     
     def _set_timer(self, params: Dict) -> Dict:
@@ -268,7 +424,7 @@ class FunctionExecutor:
         # Parse duration string
         seconds = self._parse_duration(duration_str)
         if seconds <= 0:
-            return {"success": False, "message": f"Invalid duration: {duration_str}", "data": None}
+            return _err(f"Invalid duration: {duration_str}")
         
         timer = ActiveTimer(
             label=label,
@@ -277,35 +433,27 @@ class FunctionExecutor:
         )
         
         with self._timer_lock:
-            self.active_timers[label] = timer
+            self.active_timers.add(timer)
         
-        return {
-            "success": True,
-            "message": f"Timer '{label}' set for {duration_str}",
-            "data": {"label": label, "duration": duration_str, "seconds": seconds}
-        }
+        return _ok(
+            f"Timer '{label}' set for {duration_str}",
+            {"label": label, "duration": duration_str, "seconds": seconds}
+        )
     
     def _parse_duration(self, duration_str: str) -> int:
         """Parse duration string like '10 minutes' or '1 hour 30 minutes' to seconds."""
         duration_str = duration_str.lower().strip()
         total_seconds = 0
         
-        import re
         # Match patterns like "10 minutes", "1 hour", "30 seconds"
-        patterns = [
-            (r'(\d+)\s*h(?:our)?s?', 3600),
-            (r'(\d+)\s*m(?:in(?:ute)?s?)?', 60),
-            (r'(\d+)\s*s(?:ec(?:ond)?s?)?', 1),
-        ]
-        
-        for pattern, multiplier in patterns:
-            match = re.search(pattern, duration_str)
+        for pattern, multiplier in _DURATION_PATS:
+            match = pattern.search(duration_str)
             if match:
                 total_seconds += int(match.group(1)) * multiplier
         
         # If no pattern matched, try to extract just a number (assume minutes)
         if total_seconds == 0:
-            nums = re.findall(r'\d+', duration_str)
+            nums = _NUM_RE.findall(duration_str)
             if nums:
                 total_seconds = int(nums[0]) * 60  # Default to minutes
         
@@ -317,7 +465,7 @@ class FunctionExecutor:
         label = params.get("label", "Alarm")
         
         if not self.task_manager:
-            return {"success": False, "message": "Task manager not available", "data": None}
+            return _err("Task manager not available")
         
         # Normalize time format
         normalized_time = self._normalize_time(time_str)
@@ -325,20 +473,25 @@ class FunctionExecutor:
         alarm_id = self.task_manager.add_alarm(normalized_time, label)
         
         if alarm_id:
-            return {
-                "success": True,
-                "message": f"Alarm set for {normalized_time}" + (f" ({label})" if label != "Alarm" else ""),
-                "data": {"id": alarm_id, "time": normalized_time, "label": label}
-            }
-        return {"success": False, "message": "Failed to set alarm", "data": None}
+            return _ok(
+                f"Alarm set for {normalized_time}" + (f" ({label})" if label != "Alarm" else ""),
+                {"id": alarm_id, "time": normalized_time, "label": label}
+            )
+        return _err("Failed to set alarm")
     
     def _normalize_time(self, time_str: str) -> str:
         """Normalize time string to HH:MM format."""
+        parts = self._parse_time_parts(time_str)
+        if parts:
+            return f"{parts[0]:02d}:{parts[1]:02d}"
+        return time_str.lower().strip()
+    
+    def _parse_time_parts(self, time_str: str) -> Optional[Tuple[int, int]]:
+        """Parse time string like '7am', '7:30pm' or '14:30' to (hour, minute)."""
         time_str = time_str.lower().strip()
         
-        import re
         # Match patterns like "7am", "7:30am", "14:30"
-        match = re.match(r'(\d{1,2}):?(\d{2})?\s*(am|pm)?', time_str)
+        match = _TIME_RE.match(time_str)
         if match:
             hour = int(match.group(1))
             minute = int(match.group(2)) if match.group(2) else 0
@@ -349,9 +502,9 @@ class FunctionExecutor:
             elif period == 'am' and hour == 12:
                 hour = 0
             
-            return f"{hour:02d}:{minute:02d}"
+            return hour, minute
         
-        return time_str
+        return None
     
     def _create_calendar_event(self, params: Dict) -> Dict:
         """Create a calendar event."""
@@ -361,124 +514,130 @@ class FunctionExecutor:
         duration = params.get("duration", 60)  # Default 1 hour
         
         if not self.calendar_manager:
-            return {"success": False, "message": "Calendar manager not available", "data": None}
-        
-        # Parse date
-        event_date = self._parse_date(date)
+            return _err("Calendar manager not available")
         
-        # Parse time
-        normalized_time = self._normalize_time(time_str) if time_str else "09:00"
-        
-        # Create datetime strings
-        start_dt = f"{event_date} {normalized_time}:00"
-        
-        # Calculate end time
+        # Parse date and time straight into a datetime
+        event_day = self._parse_date_obj(date)
+        parts = self._parse_time_parts(time_str) if time_str else (9, 0)
         try:
-            start = datetime.strptime(start_dt, "%Y-%m-%d %H:%M:%S")
-            end = start + timedelta(minutes=duration if isinstance(duration, int) else 60)
-            end_dt = end.strftime("%Y-%m-%d %H:%M:%S")
-        except:
-            end_dt = start_dt
+            start = datetime.combine(event_day, dt_time(*parts))
+        except (TypeError, ValueError):
+            return _err(f"Invalid time: {time_str}")
+        end = start + timedelta(minutes=duration if isinstance(duration, int) else 60)
         
-        event = self.calendar_manager.add_event(title, start_dt, end_dt)
+        event = self.calendar_manager.add_event(
+            title, start.strftime("%Y-%m-%d %H:%M:%S"), end.strftime("%Y-%m-%d %H:%M:%S")
+        )
+        self._info_cache.pop(("cal", event_day.isoformat()), None)
         
         if event:
-            return {
-                "success": True,
-                "message": f"Created event '{title}' on {date}" + (f" at {time_str}" if time_str else ""),
-                "data": event
-            }
-        return {"success": False, "message": "Failed to create event", "data": None}
+            return _ok(
+                f"Created event '{title}' on {date}" + (f" at {time_str}" if time_str else ""),
+                event
+            )
+        return _err("Failed to create event")
     
     def _parse_date(self, date_str: str) -> str:
         """Parse date string to YYYY-MM-DD format."""
+        return self._parse_date_obj(date_str).isoformat()
+    
+    def _parse_date_obj(self, date_str: str) -> date:
+        """Parse date string like 'tomorrow', 'next friday' or YYYY-MM-DD to a date."""
         date_str = date_str.lower().strip()
         
         # Try to parse as explicit date first
         try:
-            val = datetime.strptime(date_str, "%Y-%m-%d")
-            return val.strftime("%Y-%m-%d")
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
         except ValueError:
             pass
             
-        today = datetime.now()
+        today = date.today()
         
         if date_str in ("today", ""):
-            return today.strftime("%Y-%m-%d")
+            return today
         elif date_str == "tomorrow":
-            return (today + timedelta(days=1)).strftime("%Y-%m-%d")
+            return today + _ONE_DAY
         
         # Day names
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        for i, day in enumerate(days):
-            if day in date_str:
-                current_day = today.weekday()
-                days_ahead = i - current_day
-                if days_ahead <= 0:
-                    days_ahead += 7
-                if "next" in date_str:
-                    days_ahead += 7
-                target = today + timedelta(days=days_ahead)
-                return target.strftime("%Y-%m-%d")
-        
-        return today.strftime("%Y-%m-%d")
+        match = _DOW_RE.search(date_str)
+        if match:
+            # Pure int math: ordinal 1 (0001-01-01) is a Monday
+            ordinal = today.toordinal()
+            days_ahead = _DOW[match.group(1)] - (ordinal - 1) % 7
+            if days_ahead <= 0:
+                days_ahead += 7
+            if "next" in date_str:
+                days_ahead += 7
+            return date.fromordinal(ordinal + days_ahead)
+        
+        return today
     
     def _add_task(self, params: Dict) -> Dict:
         """Add a task to the to-do list."""
         text = params.get("text", "")
         
         if not text:
-            return {"success": False, "message": "No task text provided", "data": None}
+            return _err("No task text provided")
         
         if not self.task_manager:
-            return {"success": False, "message": "Task manager not available", "data": None}
+            return _err("Task manager not available")
         
         task = self.task_manager.add_task(text)
         
         if task:
-            return {
-                "success": True,
-                "message": f"Added task: {text}",
-                "data": task
-            }
-        return {"success": False, "message": "Failed to add task", "data": None}
+            return _ok(f"Added task: {text}", task)
+        return _err("Failed to add task")
+    
+    def _close_ddgs(self):
+        """Release the cached DuckDuckGo client (via its context-manager exit, which every DDGS version has)."""
+        ddgs, self._ddgs = self._ddgs, None
+        if ddgs is not None:
+            ddgs.__exit__(None, None, None)
     
     def _web_search(self, params: Dict) -> Dict:
         """Perform a web search."""
         query = params.get("query", "")
         
         if not query:
-            return {"success": False, "message": "No search query provided", "data": None}
+            return _err("No search query provided")
         
         try:
-            from duckduckgo_search import DDGS
+            if self._ddgs is None:
+                from duckduckgo_search import DDGS
+                self._ddgs = DDGS()
+                atexit.register(self._close_ddgs)
             
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=5))
+            results = list(self._ddgs.text(query, max_results=3))
             
             if results:
-                # Format results for display
-                formatted = []
-                for r in results[:3]:
-                    formatted.append({
-                        "title": r.get("title", ""),
-                        "body": r.get("body", "")[:200],
-                        "url": r.get("href", "")
-                    })
+                # Format results for display (DDGS text results always carry these keys)
+                formatted = [
+                    {"title": r["title"], "body": r["body"][:200], "url": r["href"]}
+                    for r in results
+                ]
                 
-                return {
-                    "success": True,
-                    "message": f"Found {len(results)} results for '{query}'",
-                    "data": {"query": query, "results": formatted}
-                }
+                return _ok(
+                    f"Found {len(results)} results for '{query}'",
+                    {"query": query, "results": formatted}
+                )
             
-            return {"success": True, "message": f"No results found for '{query}'", "data": None}
+            return _ok(f"No results found for '{query}'")
             
         except Exception as e:
-            return {"success": False, "message": f"Search failed: {e}", "data": None}
+            return _err(f"Search failed: {e}")
     
     # === System Info ===
     
+    def _cached(self, key: tuple, fetch, *args, **kwargs):
+        """Return fetch(*args, **kwargs), reusing the result within one TTL bucket."""
+        bucket = int(time.time() // self.INFO_CACHE_TTL)
+        hit = self._info_cache.get(key)
+        if hit is not None and hit[0] == bucket:
+            return hit[1]
+        value = fetch(*args, **kwargs)
+        self._info_cache[key] = (bucket, value)
+        return value
+    
     def _get_system_info(self) -> Dict:
         """Aggregate all system information."""
         info = {
@@ -492,55 +651,72 @@ class FunctionExecutor:
             "news": []
         }
         
+        # Fan out the I/O-bound lookups so latency is the slowest one, not the sum
+        today = date.today().isoformat()
+        pending = {}
+        if self.task_manager:
+            pending["alarms"] = self._io_pool.submit(self.task_manager.get_alarms)
+            pending["tasks"] = self._io_pool.submit(self.task_manager.get_tasks)
+        if self.calendar_manager:
+            pending["calendar"] = self._io_pool.submit(
+                self._cached, ("cal", today), self.calendar_manager.get_events, today)
+        if self.weather_manager:
+            pending["weather"] = self._io_pool.submit(
+                self._cached, ("weather",), self.weather_manager.get_weather)
+        if self.news_manager:
+            pending["news"] = self._io_pool.submit(
+                self._cached, ("news",), self.news_manager.get_briefing, use_ai=False)
+        deadline = time.monotonic() + 5
+        
+        def result(key):
+            return pending[key].result(timeout=max(0, deadline - time.monotonic()))
+        
         # Active timers
         with self._timer_lock:
-            for label, timer in list(self.active_timers.items()):
-                if timer.is_expired:
-                    del self.active_timers[label]
-                else:
-                    info["timers"].append({
-                        "label": timer.label,
-                        "remaining": timer.format_remaining()
-                    })
+            now = time.time()
+            for timer in self.active_timers.advance(now):
+                info["timers"].append({
+                    "label": timer.label,
+                    "remaining": timer.format_remaining(now)
+                })
+        
+        # Smart devices
+        if self.kasa_manager and self.kasa_manager.devices:
+            for ip, device in self.kasa_manager.devices.items():
+                info["smart_devices"].append({
+                    "name": device.get("alias", "Unknown"),
+                    "is_on": device.get("is_on", False),
+                    "type": device.get("type", "Unknown")
+                })
         
         # Alarms
-        if self.task_manager:
+        if "alarms" in pending:
             try:
-                alarms = self.task_manager.get_alarms()
+                alarms = result("alarms")
                 info["alarms"] = [{"time": a["time"], "label": a["label"]} for a in alarms]
             except:
                 pass
         
         # Calendar events today
-        if self.calendar_manager:
+        if "calendar" in pending:
             try:
-                today = datetime.now().strftime("%Y-%m-%d")
-                events = self.calendar_manager.get_events(today)
+                events = result("calendar")
                 info["calendar_today"] = [{"title": e["title"], "time": e["start_time"]} for e in events]
             except:
                 pass
         
         # Tasks
-        if self.task_manager:
+        if "tasks" in pending:
             try:
-                tasks = self.task_manager.get_tasks()
+                tasks = result("tasks")
                 info["tasks"] = [{"text": t["text"], "completed": t["completed"]} for t in tasks]
             except:
                 pass
         
-        # Smart devices
-        if self.kasa_manager and self.kasa_manager.devices:
-            for ip, device in self.kasa_manager.devices.items():
-                info["smart_devices"].append({
-                    "name": device.get("alias", "Unknown"),
-                    "is_on": device.get("is_on", False),
-                    "type": device.get("type", "Unknown")
-                })
-        
         # Weather
-        if self.weather_manager:
+        if "weather" in pending:
             try:
-                weather = self.weather_manager.get_weather()
+                weather = result("weather")
                 if weather and "current" in weather:
                     current = weather["current"]
                     info["weather"] = {
@@ -553,10 +729,10 @@ class FunctionExecutor:
                 pass
         
         # News
-        if self.news_manager:
+        if "news" in pending:
             try:
                 # Get recent news (cached or fresh)
-                news_items = self.news_manager.get_briefing(use_ai=False)
+                news_items = result("news")
                 # Limit to top 5 for system info
                 info["news"] = [
                     {
@@ -570,11 +746,7 @@ class FunctionExecutor:
                 print(f"[FunctionExecutor] News fetch error: {e}")
                 pass
         
-        return {
-            "success": True,
-            "message": "System info retrieved",
-            "data": info
-        }
+        return _ok("System info retrieved", info)
 
 
 # Global instance
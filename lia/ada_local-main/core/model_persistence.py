@@ -16,14 +16,31 @@ from core.model_manager import get_running_models, sync_unload_model
 class QwenModelManager:
     """Manages Qwen model lifecycle - load, keep alive, and sleep."""
     
+    # Monitor wait phases after activity: (phase ends after N seconds, wait per tick)
+    # Poll tightly right after use, then back off, then park for the whole remaining TTL.
+    MONITOR_PHASES = ((0.1, 0.01), (1.0, 1.0))
+    
+    # check_status() reuses the last /api/ps answer for this long (GUI polls it on repaint)
+    RUNNING_CACHE_TTL = 2.0
+    
     def __init__(self):
         self.model_name = RESPONDER_MODEL
         self.last_used_time: Optional[float] = None
         self.is_loaded = False
         self.lock = threading.Lock()
-        self.timeout_thread: Optional[threading.Thread] = None
         self.monitoring = False
+        self._wake = threading.Event()  # Interrupts the monitor's wait on load/use/unload
+        self._load_in_progress: Optional[threading.Event] = None  # Set when the in-flight load finishes
+        self._running_cache: Optional[tuple] = None  # (fetched_at, running_models)
         self.http_session = requests.Session()
+        
+        # Single long-lived monitor; it idles on self._wake while nothing is loaded
+        self.timeout_thread = threading.Thread(
+            target=self._timeout_monitor_loop,
+            name="QwenTimeoutMonitor",
+            daemon=True
+        )
+        self.timeout_thread.start()
     
     def ensure_loaded(self) -> bool:
         """Ensure Qwen model is loaded. Load if not already loaded."""
@@ -33,114 +50,148 @@ class QwenModelManager:
                 self.last_used_time = time.time()
                 return True
             
-            # Check if already running in Ollama (persistence restart case)
-            running_models = get_running_models()
-            if self.model_name in running_models or any(self.model_name in m for m in running_models):
-                print(f"{CYAN}[QwenManager] {self.model_name} already running in Ollama.{RESET}")
-                self.is_loaded = True
-                self.last_used_time = time.time()
-                self._start_timeout_monitor()
-                return True
-            
-            # Load the model
-            try:
-                print(f"{CYAN}[QwenManager] Loading {self.model_name}...{RESET}")
-                response = self.http_session.post(
-                    f"{OLLAMA_URL}/generate",
-                    json={
-                        "model": self.model_name,
-                        "prompt": "hi",
-                        "stream": False,
-                        "keep_alive": QWEN_KEEP_ALIVE,
-                        "options": {"num_predict": 1}
-                    },
-                    timeout=120
-                )
-                
-                if response.status_code == 200:
+            # Only one thread talks to Ollama; the rest wait for its result
+            pending = self._load_in_progress
+            is_loader = pending is None
+            if is_loader:
+                pending = self._load_in_progress = threading.Event()
+        
+        if not is_loader:
+            pending.wait()
+            with self.lock:
+                if self.is_loaded:
+                    self.last_used_time = time.time()
+                return self.is_loaded
+        
+        try:
+            # HTTP happens outside self.lock so mark_used()/check_status()/monitor never stall on it
+            loaded = self._load_model()
+            with self.lock:
+                if loaded:
                     self.is_loaded = True
                     self.last_used_time = time.time()
-                    print(f"{CYAN}[QwenManager] {self.model_name} loaded.{RESET}")
                     
-                    # Start timeout monitoring
-                    self._start_timeout_monitor()
-                    return True
-                else:
-                    print(f"{GRAY}[QwenManager] Failed to load {self.model_name}: {response.status_code}{RESET}")
-                    return False
-            except Exception as e:
-                print(f"{GRAY}[QwenManager] Error loading {self.model_name}: {e}{RESET}")
+                    # Arm timeout monitoring
+                    self.monitoring = True
+                    self._wake.set()
+            return loaded
+        finally:
+            with self.lock:
+                self._load_in_progress = None
+            pending.set()
+    
+    def _load_model(self) -> bool:
+        """Load the model into Ollama (or adopt it if already running). Must not hold self.lock."""
+        # Check if already running in Ollama (persistence restart case)
+        if self._is_running(get_running_models()):
+            print(f"{CYAN}[QwenManager] {self.model_name} already running in Ollama.{RESET}")
+            return True
+        
+        # Load the model
+        try:
+            print(f"{CYAN}[QwenManager] Loading {self.model_name}...{RESET}")
+            response = self.http_session.post(
+                f"{OLLAMA_URL}/generate",
+                json={
+                    "model": self.model_name,
+                    "prompt": "hi",
+                    "stream": False,
+                    "keep_alive": QWEN_KEEP_ALIVE,
+                    "options": {"num_predict": 1}
+                },
+                timeout=120
+            )
+            
+            if response.status_code == 200:
+                print(f"{CYAN}[QwenManager] {self.model_name} loaded.{RESET}")
+                return True
+            else:
+                print(f"{GRAY}[QwenManager] Failed to load {self.model_name}: {response.status_code}{RESET}")
                 return False
+        except Exception as e:
+            print(f"{GRAY}[QwenManager] Error loading {self.model_name}: {e}{RESET}")
+            return False
     
     def mark_used(self):
         """Mark model as used (update timestamp)."""
         with self.lock:
             self.last_used_time = time.time()
-            if not self.is_loaded:
-                self.ensure_loaded()
-            elif self.monitoring:
-                # Restart timeout monitoring
-                self._start_timeout_monitor()
+            needs_load = not self.is_loaded
+        
+        if needs_load:
+            self.ensure_loaded()
+        else:
+            # Let the monitor recompute its deadline from the new timestamp
+            self._wake.set()
     
     def unload(self, reason: str = "manual"):
         """Unload Qwen model to free VRAM."""
         with self.lock:
-            if not self.is_loaded:
-                return
-            
-            try:
-                print(f"{GRAY}[QwenManager] Unloading {self.model_name} ({reason})...{RESET}")
-                sync_unload_model(self.model_name)
-                self.is_loaded = False
-                self.last_used_time = None
-                self.monitoring = False
-                print(f"{GRAY}[QwenManager] {self.model_name} unloaded.{RESET}")
-            except Exception as e:
-                print(f"{GRAY}[QwenManager] Error unloading {self.model_name}: {e}{RESET}")
+            self._unload_locked(reason)
     
-    def _start_timeout_monitor(self):
-        """Start or restart timeout monitoring thread."""
-        self.monitoring = True
-        
-        # Stop existing thread if any
-        if self.timeout_thread and self.timeout_thread.is_alive():
-            # Thread will check self.monitoring and exit
-            pass
+    def _unload_locked(self, reason: str):
+        """Unload the model. Caller must hold self.lock."""
+        if not self.is_loaded:
+            return
         
-        # Start new monitoring thread
-        self.timeout_thread = threading.Thread(
-            target=self._timeout_monitor_loop,
-            daemon=True
-        )
-        self.timeout_thread.start()
+        try:
+            print(f"{GRAY}[QwenManager] Unloading {self.model_name} ({reason})...{RESET}")
+            sync_unload_model(self.model_name)
+            self.is_loaded = False
+            self.last_used_time = None
+            self.monitoring = False
+            self._wake.set()
+            print(f"{GRAY}[QwenManager] {self.model_name} unloaded.{RESET}")
+        except Exception as e:
+            print(f"{GRAY}[QwenManager] Error unloading {self.model_name}: {e}{RESET}")
     
     def _timeout_monitor_loop(self):
         """Monitor for timeout and unload model if inactive."""
-        while self.monitoring:
-            time.sleep(10)  # Check every 10 seconds
+        while True:
+            wait_s = None  # Nothing loaded: park until a load wakes us
             
             with self.lock:
-                if not self.monitoring or not self.is_loaded:
-                    break
-                
-                if self.last_used_time is None:
-                    continue
-                
-                elapsed = time.time() - self.last_used_time
-                
-                if elapsed >= QWEN_TIMEOUT_SECONDS:
-                    print(f"{GRAY}[QwenManager] Timeout reached ({elapsed:.0f}s), unloading {self.model_name}...{RESET}")
-                    self.unload("timeout")
-                    break
+                if self.monitoring and self.is_loaded and self.last_used_time is not None:
+                    elapsed = time.time() - self.last_used_time
+                    
+                    if elapsed >= QWEN_TIMEOUT_SECONDS:
+                        print(f"{GRAY}[QwenManager] Timeout reached ({elapsed:.0f}s), unloading {self.model_name}...{RESET}")
+                        self._unload_locked("timeout")
+                        continue
+                    
+                    wait_s = min(QWEN_TIMEOUT_SECONDS - elapsed, self._phase_wait(elapsed))
+            
+            # Sleep until the deadline, or until ensure_loaded()/mark_used()/unload() wakes us
+            if self._wake.wait(wait_s):
+                self._wake.clear()
+    
+    def _phase_wait(self, since_activity: float) -> float:
+        """Return the monitor tick for the current backoff phase."""
+        for phase_end, wait_s in self.MONITOR_PHASES:
+            if since_activity < phase_end:
+                return wait_s
+        return QWEN_TIMEOUT_SECONDS
+    
+    def _is_running(self, running_models: list) -> bool:
+        """Single pass: a substring match also covers the exact-name case."""
+        return any(self.model_name in m for m in running_models)
+    
+    def _cached_running_models(self) -> list:
+        """Return get_running_models(), refreshed at most every RUNNING_CACHE_TTL seconds."""
+        cached = self._running_cache
+        now = time.time()
+        if cached is not None and now - cached[0] < self.RUNNING_CACHE_TTL:
+            return cached[1]
+        
+        running_models = get_running_models()
+        self._running_cache = (now, running_models)
+        return running_models
     
     def check_status(self) -> dict:
         """Get current status of Qwen model."""
+        is_running = self._is_running(self._cached_running_models())
+        
         with self.lock:
-            running_models = get_running_models()
-            is_running = self.model_name in running_models or any(
-                self.model_name in m for m in running_models
-            )
-            
             return {
                 "is_loaded": self.is_loaded,
                 "is_running": is_running,
@@ -4,13 +4,29 @@ Saves settings to ~/.pocket_ai/settings.json
 Optimized for LIA - Algerian AI Assistant.
 """
 
+import atexit
 import json
+import os
 import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from PySide6.QtCore import QObject, Signal
 
+# orjson اختياري: أسرع بزاف ويكتب UTF-8 مباشرة، وإلا نرجعو لـ json العادي
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+
 
 # الإعدادات الافتراضية - مخصصة لـ LIA
 DEFAULT_SETTINGS = {
@@ -44,6 +60,14 @@ DEFAULT_SETTINGS = {
 }
 
 
+# نسخة مجمدة من الافتراضيات - json.loads كيعطي نسخة عميقة جديدة بسرعة
+_FROZEN_DEFAULTS = _dumps(DEFAULT_SETTINGS)
+
+
+def _fresh_defaults() -> Dict[str, Any]:
+    return _loads(_FROZEN_DEFAULTS)
+
+
 class SettingsStore(QObject):
     """
     مدير الإعدادات الآمن مع دعم الإشارات لضمان استجابة الواجهة بسرعة.
@@ -51,40 +75,68 @@ class SettingsStore(QObject):
     
     setting_changed = Signal(str, object)
     
+    SAVE_DELAY = 0.25  # ثواني - نجمعو التغييرات المتتالية في كتابة وحدة
+    
     def __init__(self):
         super().__init__()
         self._lock = threading.RLock()
         self._settings: Dict[str, Any] = {}
         self._settings_dir = Path.home() / ".pocket_ai"
         self._settings_file = self._settings_dir / "settings.json"
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._split_cache: Dict[str, tuple] = {}  # "a.b.c" -> ("a", "b", "c")
         
         self._load()
+        atexit.register(self._flush)
     
     def _load(self):
         """تحميل الإعدادات أو تهيئة LIA لأول مرة."""
         with self._lock:
             if self._settings_file.exists():
                 try:
-                    with open(self._settings_file, 'r', encoding='utf-8') as f:
-                        loaded = json.load(f)
-                    self._settings = self._deep_merge(DEFAULT_SETTINGS.copy(), loaded)
+                    with open(self._settings_file, 'rb') as f:
+                        loaded = _loads(f.read())
+                    self._settings = self._deep_merge(_fresh_defaults(), loaded)
                 except (json.JSONDecodeError, IOError) as e:
                     print(f"[Settings] Error: {e}. Resetting to LIA defaults.")
-                    self._settings = DEFAULT_SETTINGS.copy()
+                    self._settings = _fresh_defaults()
             else:
-                self._settings = DEFAULT_SETTINGS.copy()
+                self._settings = _fresh_defaults()
                 self._save()
     
     def _save(self):
-        """حفظ الإعدادات مع دعم الحروف العربية."""
+        """حفظ الإعدادات مع دعم الحروف العربية (كتابة ذرية عبر ملف مؤقت)."""
         with self._lock:
             try:
                 self._settings_dir.mkdir(parents=True, exist_ok=True)
-                with open(self._settings_file, 'w', encoding='utf-8') as f:
-                    json.dump(self._settings, f, indent=2, ensure_ascii=False)
+                tmp_file = self._settings_file.with_suffix(".json.tmp")
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dumps(self._settings))
+                os.replace(tmp_file, self._settings_file)
+                self._dirty = False
             except IOError as e:
                 print(f"[Settings] Save error: {e}")
     
+    def _schedule_save(self):
+        """تأجيل الحفظ: كل set() يعاود يبدا المؤقت، والكتابة تصرا مرة وحدة بعد ما يهدا."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _flush(self):
+        """كتابة التغييرات المعلقة إلى الملف إذا كاين."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._save()
+    
     def _deep_merge(self, base: dict, override: dict) -> dict:
         result = base.copy()
         for key, value in override.items():
@@ -94,9 +146,15 @@ class SettingsStore(QObject):
                 result[key] = value
         return result
     
+    def _split(self, key_path: str) -> tuple:
+        parts = self._split_cache.get(key_path)
+        if parts is None:
+            parts = self._split_cache.setdefault(key_path, tuple(key_path.split('.')))
+        return parts
+    
     def get(self, key_path: str, default: Any = None) -> Any:
+        keys = self._split(key_path)
         with self._lock:
-            keys = key_path.split('.')
             value = self._settings
             try:
                 for k in keys:
@@ -106,21 +164,21 @@ class SettingsStore(QObject):
                 return default
     
     def set(self, key_path: str, value: Any):
+        keys = self._split(key_path)
         with self._lock:
-            keys = key_path.split('.')
             target = self._settings
             for k in keys[:-1]:
                 if k not in target: target[k] = {}
                 target = target[k]
             target[keys[-1]] = value
-            self._save()
+            self._schedule_save()
         
         self.setting_changed.emit(key_path, value)
 
     def reset_to_defaults(self):
         with self._lock:
-            self._settings = DEFAULT_SETTINGS.copy()
-            self._save()
+            self._settings = _fresh_defaults()
+            self._schedule_save()
         self.setting_changed.emit("*", None)
 
-settings = SettingsStore()ا
\ No newline at end of file
+settings = SettingsStore()
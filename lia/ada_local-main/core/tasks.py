@@ -1,6 +1,8 @@
 import sqlite3
 import uuid
 import os
+import atexit
+import threading
 from typing import List, Dict, Optional
 
 class TaskManager:
@@ -8,103 +10,116 @@ class TaskManager:
     
     def __init__(self, db_path: str = "data/tasks.db"):
         self.db_path = db_path
+        self._lock = threading.Lock()
         self._init_db()
+        atexit.register(self.close)
         
     def _init_db(self):
-        """Initialize the database and create table if not exists."""
+        """Open the shared connection and create tables if not exist."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id TEXT PRIMARY KEY,
-                    text TEXT NOT NULL,
-                    completed BOOLEAN DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.commit()
+        # One long-lived connection; GUI and executor threads are serialized through self._lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        
+        self._conn.executescript("""
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                completed BOOLEAN DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at);
+            CREATE TABLE IF NOT EXISTS alarms (
+                id TEXT PRIMARY KEY,
+                time TEXT NOT NULL,
+                label TEXT,
+                enabled BOOLEAN DEFAULT 1
+            );
+            COMMIT;
+        """)
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
             
     def get_tasks(self) -> List[Dict]:
         """Retrieve all tasks ordered by creation time."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM tasks ORDER BY created_at ASC")
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+            with self._lock:
+                rows = self._conn.execute("SELECT * FROM tasks ORDER BY created_at ASC").fetchall()
+            return [dict(row) for row in rows]
         except Exception as e:
             print(f"Error loading tasks: {e}")
             return []
 
     def add_task(self, text: str) -> Optional[Dict]:
         """Add a new task and return the task object."""
-        task_id = str(uuid.uuid4())
+        tasks = self.add_tasks_bulk([text])
+        return tasks[0] if tasks else None
+
+    def add_tasks_bulk(self, texts: List[str]) -> List[Dict]:
+        """Add many tasks in a single transaction and return the task objects."""
+        created = [
+            {
+                "id": str(uuid.uuid4()),
+                "text": text,
+                "completed": False,
+                "created_at": None # We don't need accurate timestamp immediately for UI
+            }
+            for text in texts
+        ]
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO tasks (id, text, completed) VALUES (?, ?, ?)",
-                    (task_id, text, False)
-                )
-                conn.commit()
-                
-                # return the new task
-                return {
-                    "id": task_id,
-                    "text": text,
-                    "completed": False,
-                    "created_at": None # We don't need accurate timestamp immediately for UI
-                }
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        "INSERT INTO tasks (id, text, completed) VALUES (?, ?, ?)",
+                        [(t["id"], t["text"], False) for t in created]
+                    )
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            return created
         except Exception as e:
-            print(f"Error adding task: {e}")
-            return None
+            print(f"Error adding tasks: {e}")
+            return []
 
     def delete_task(self, task_id: str):
         """Delete a task by ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-                conn.commit()
+            with self._lock:
+                self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
         except Exception as e:
             print(f"Error deleting task: {e}")
 
     def toggle_task(self, task_id: str, completed: bool):
         """Update task completion status."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._lock:
+                self._conn.execute(
                     "UPDATE tasks SET completed = ? WHERE id = ?",
                     (completed, task_id)
                 )
-                conn.commit()
         except Exception as e:
             print(f"Error toggling task: {e}")
 
     def add_alarm(self, time: str, label: str):
         """Add a new alarm."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                # Ensure table exists (lazy init for existing users)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS alarms (
-                        id TEXT PRIMARY KEY,
-                        time TEXT NOT NULL,
-                        label TEXT,
-                        enabled BOOLEAN DEFAULT 1
-                    )
-                """)
+            with self._lock:
                 alarm_id = str(uuid.uuid4())
-                cursor.execute(
+                self._conn.execute(
                     "INSERT INTO alarms (id, time, label) VALUES (?, ?, ?)",
                     (alarm_id, time, label)
                 )
-                conn.commit()
                 return alarm_id
         except Exception as e:
             print(f"Error adding alarm: {e}")
@@ -113,25 +128,17 @@ class TaskManager:
     def get_alarms(self) -> List[Dict]:
         """Get all alarms."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='alarms'")
-                if not cursor.fetchone():
-                    return []
-                    
-                cursor.execute("SELECT * FROM alarms ORDER BY time ASC")
-                return [dict(row) for row in cursor.fetchall()]
+            with self._lock:
+                rows = self._conn.execute("SELECT * FROM alarms ORDER BY time ASC").fetchall()
+            return [dict(row) for row in rows]
         except Exception as e:
             return []
 
     def delete_alarm(self, alarm_id: str):
         """Delete an alarm."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM alarms WHERE id = ?", (alarm_id,))
-                conn.commit()
+            with self._lock:
+                self._conn.execute("DELETE FROM alarms WHERE id = ?", (alarm_id,))
         except Exception as e:
             print(f"Error deleting alarm: {e}")
 
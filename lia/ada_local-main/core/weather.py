@@ -1,15 +1,48 @@
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from core.settings_store import settings
 
+# WMO weather code -> short description
+_WMO_TEXT = {
+    0: "Clear",
+    1: "Cloudy", 2: "Cloudy", 3: "Cloudy",
+    45: "Foggy", 48: "Foggy",
+    51: "Rain", 53: "Rain", 55: "Rain", 61: "Rain", 63: "Rain", 65: "Rain",
+    71: "Snow", 73: "Snow", 75: "Snow", 85: "Snow", 86: "Snow",
+    95: "Storm", 96: "Storm", 99: "Storm",
+}
+
+# WMO weather code -> (description, day icon, night icon)
+_CONDITION_ICONS = {
+    0: ("Clear", "Sunny", "QuietHours"),  # QuietHours looks like a moon/bed
+    1: ("Partly Cloudy", "PartlyCloudyDay", "PartlyCloudyNight"),  # Need to check if these exist in FIF
+    2: ("Partly Cloudy", "PartlyCloudyDay", "PartlyCloudyNight"),
+}
+
 class WeatherManager:
     """
     Manages weather data fetching from Open-Meteo API.
     """
+    CACHE_TTL_SECONDS = 600  # Open-Meteo data only changes hourly
+    REQUEST_TIMEOUT = (1.5, 5)  # (connect, read) - fail fast on a dead network
+    
     def __init__(self):
         self.base_url = "https://api.open-meteo.com/v1/forecast"
         self.current_weather = None
         self.last_fetch = None
+        self._fetch_coords = None
+        self._fetch_lock = threading.Lock()
+        
+        # Persistent session so repeated fetches reuse the TLS connection
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_maxsize=4,
+            pool_block=True,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        ))
     
     @property
     def lat(self):
@@ -22,13 +55,25 @@ class WeatherManager:
         return settings.get("weather.longitude", -74.0060)
 
     def get_weather(self):
+        """
+        Returns current and hourly weather as a dict, cached for CACHE_TTL_SECONDS.
+        """
+        coords = (self.lat, self.lon)
+        # One fetch at a time; concurrent callers reuse its result
+        with self._fetch_lock:
+            if (self.current_weather and self.last_fetch and self._fetch_coords == coords
+                    and (datetime.now() - self.last_fetch).total_seconds() < self.CACHE_TTL_SECONDS):
+                return self.current_weather
+            return self._fetch_weather(*coords)
+
+    def _fetch_weather(self, lat, lon):
         """
         Fetches current and hourly weather. Returns dict.
         """
         try:
             params = {
-                "latitude": self.lat,
-                "longitude": self.lon,
+                "latitude": lat,
+                "longitude": lon,
                 "current": "temperature_2m,weather_code,is_day",
                 "hourly": "temperature_2m,weather_code",
                 "temperature_unit": "fahrenheit",
@@ -36,7 +81,7 @@ class WeatherManager:
                 "forecast_days": 1
             }
             
-            response = requests.get(self.base_url, params=params, timeout=5)
+            response = self._session.get(self.base_url, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -60,28 +105,17 @@ class WeatherManager:
             # We can simplify by just taking the index corresponding to 'now_hour'
             # The API returns 24 hours starting at 00:00 for the day if we requested 1 day.
             
-            forecast = []
-            for i in range(now_hour, min(now_hour + 5, len(times))): 
-                 # Skip current hour effectively or include? User image shows 2PM, 4PM... 
-                 # Let's take next few hours.
-                 # Actually let's take i, i+2, i+4, i+6 to match the "spread" look or just next 4 hours?
-                 # Image shows 2PM, 4PM, 6PM, 8PM -> 2 hour intervals.
-                 if i < len(times):
-                     t_str = datetime.fromisoformat(times[i]).strftime("%I%p").lstrip("0")
-                     forecast.append({
-                         "time": t_str,
-                         "temp": temps[i],
-                         "code": codes[i]
-                     })
-            
-            # If we want 2-hour steps:
+            # 2-hour steps (e.g. 2PM, 4PM, 6PM, 8PM)
+            window = slice(now_hour, now_hour + 7, 2)
             forecast_step = []
-            for i in range(now_hour, min(now_hour + 7, len(times)), 2):
-                t_str = datetime.fromisoformat(times[i]).strftime("%I%p").lstrip("0")
+            for t, temp, code in zip(times[window], temps[window], codes[window]):
+                # Open-Meteo times are always "YYYY-MM-DDTHH:MM" - slice the hour instead of parsing
+                hh = int(t[11:13])
+                t_str = f"{(hh - 1) % 12 + 1}{'AM' if hh < 12 else 'PM'}"
                 forecast_step.append({
                     "time": t_str,
-                    "temp": temps[i],
-                    "code": codes[i]
+                    "temp": temp,
+                    "code": code
                 })
                 
             self.current_weather["forecast"] = forecast_step[:4] # Format: list of dicts
@@ -92,6 +126,7 @@ class WeatherManager:
             self.current_weather["low"] = min(temps) if temps else 0
             
             self.last_fetch = datetime.now()
+            self._fetch_coords = (lat, lon)
             return self.current_weather
             
         except Exception as e:
@@ -116,11 +151,10 @@ class WeatherManager:
         
         # We return FluentIcon names that closely match
         
-        if code == 0:
-            return "Clear", "Sunny" if is_day else "QuietHours" # QuietHours looks like a moon/bed
-        
-        if code in [1, 2]:
-            return "Partly Cloudy", "PartlyCloudyDay" if is_day else "PartlyCloudyNight" # Need to check if these exist in FIF
+        icons = _CONDITION_ICONS.get(code)
+        if icons:
+            text, day_icon, night_icon = icons
+            return text, day_icon if is_day else night_icon
             # Fallback to safe icons if unsure:
             # Sunny -> BRIGHTNESS
             # Cloudy -> CLOUD
@@ -149,12 +183,6 @@ class WeatherManager:
         return self._code_to_text(code)
 
     def _code_to_text(self, code):
-        if code == 0: return "Clear"
-        if code in [1, 2, 3]: return "Cloudy"
-        if code in [45, 48]: return "Foggy"
-        if code in [51, 53, 55, 61, 63, 65]: return "Rain"
-        if code in [71, 73, 75, 85, 86]: return "Snow"
-        if code in [95, 96, 99]: return "Storm"
-        return "Unknown"
+        return _WMO_TEXT.get(code, "Unknown")
 
 weather_manager = WeatherManager()
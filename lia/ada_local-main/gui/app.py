@@ -2,10 +2,9 @@
 LIA - PySide6 application setup and layout using Fluent Widgets.
 """
 
-import threading
 import sys
 from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout
-from PySide6.QtCore import Qt, QSize, QThread
+from PySide6.QtCore import Qt, QSize, QThread, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QIcon
 
 from qfluentwidgets import (
@@ -15,6 +14,22 @@ from qfluentwidgets import (
 
 # ... (كل الاستيرادات الأخرى تبقى كما هي بدون تغيير) ...
 
+class VAInitSignals(QObject):
+    """Lives on the GUI thread so `ready` is delivered there."""
+    ready = Signal(bool)
+
+
+class VAInitTask(QRunnable):
+    """Runs the slow voice_assistant.initialize() on Qt's shared thread pool."""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = VAInitSignals()
+    
+    def run(self):
+        self.signals.ready.emit(voice_assistant.initialize())
+
+
 class MainWindow(FluentWindow):
     """Main application window using Fluent Design - LIA Edition."""
     
@@ -60,17 +75,23 @@ class MainWindow(FluentWindow):
             voice_assistant.calendar_updated.connect(self._on_voice_calendar_updated)
             voice_assistant.task_added.connect(self._on_voice_task_added)
             
-            def init_va():
-                if voice_assistant.initialize():
-                    tts.toggle(True)
-                    # جعل الصوت العربي أسرع قليلاً للاستجابة المرحة
-                    if hasattr(tts, 'set_rate'): tts.set_rate("+15%") 
-                    voice_assistant.start()
-                    print(f"[App] ✓ LIA is online | راني واجدة")
-                else:
-                    print(f"[App] ✗ Failed to initialize LIA")
-            
-            threading.Thread(target=init_va, daemon=True).start()
+            # التهيئة الثقيلة في QThreadPool، والتشغيل يرجع للـ GUI thread
+            self._va_init_task = VAInitTask()
+            self._va_init_task.setAutoDelete(False)
+            self._va_init_task.signals.ready.connect(self._on_voice_assistant_ready)
+            QThreadPool.globalInstance().start(self._va_init_task)
+    
+    def _on_voice_assistant_ready(self, ok: bool):
+        """Finish voice assistant startup on the GUI thread."""
+        self._va_init_task = None
+        if ok:
+            tts.toggle(True)
+            # جعل الصوت العربي أسرع قليلاً للاستجابة المرحة
+            if hasattr(tts, 'set_rate'): tts.set_rate("+15%") 
+            voice_assistant.start()
+            print(f"[App] ✓ LIA is online | راني واجدة")
+        else:
+            print(f"[App] ✗ Failed to initialize LIA")
 
     def _init_window(self):
         # Dashboard
@@ -101,6 +122,18 @@ class MainWindow(FluentWindow):
             NavigationItemPosition.BOTTOM
         )
 
+    def promote_thinking(self, response_bubble):
+        """Forward to the chat tab: put the thinking widget into its row on first use."""
+        chat = self.chat_lazy.actual_widget
+        if chat:
+            chat.promote_thinking(response_bubble)
+
+    def promote_search(self, response_bubble):
+        """Forward to the chat tab: put the search indicator into its row on first use."""
+        chat = self.chat_lazy.actual_widget
+        if chat:
+            chat.promote_search(response_bubble)
+
     # ... (بقية الميثودز من _on_wake_word_detected إلى closeEvent تبقى كما هي تماماً) ...
 
     def _init_background(self):
@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 # إعدادات الصفحة
@@ -14,6 +15,23 @@ OLLAMA_URL = "http://localhost:11434/api/generate"
 # تعريف شخصية LIA (System Prompt)
 SYSTEM_PROMPT = "أنتِ LIA، مساعدة ذكية جزائرية مرحة وفايقة. تحدثي بالدارجة الجزائرية."
 
+# جلسة HTTP وحدة تتعاود بين الرسائل باش ما نعاودوش نفتحو الاتصال مع Ollama
+@st.cache_resource
+def make_session():
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=4, pool_block=True))
+    return session
+
+# Ollama كيبعث سطر JSON لكل كلمة - نعطيوها لـ st.write_stream وحدة بوحدة
+def ollama_tokens(response):
+    for line in response.iter_lines():
+        if not line:
+            continue
+        chunk = json.loads(line)
+        yield chunk.get("response", "")
+        if chunk.get("done"):
+            break
+
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
@@ -30,16 +48,17 @@ if prompt := st.chat_input("واش حاب تقولي لـ ليا؟"):
 
     # طلب الرد من Ollama
     with st.chat_message("assistant"):
-        with st.spinner("ليا راهي تخمم..."):
-            try:
-                payload = {
-                    "model": "qwen3:1.7b",
-                    "prompt": f"{SYSTEM_PROMPT}\nالمستخدم: {prompt}\nLIA:",
-                    "stream": False
-                }
-                response = requests.post(OLLAMA_URL, json=payload)
-                full_response = response.json()['response']
-                st.markdown(full_response)
-                st.session_state.messages.append({"role": "assistant", "content": full_response})
-            except:
-                st.error("خطأ: تأكد من تشغيل Ollama في جهازك!")
\ No newline at end of file
+        try:
+            payload = {
+                "model": "qwen3:1.7b",
+                "prompt": f"{SYSTEM_PROMPT}\nالمستخدم: {prompt}\nLIA:",
+                "stream": True
+            }
+            with st.spinner("ليا راهي تخمم..."):
+                response = make_session().post(OLLAMA_URL, json=payload, stream=True, timeout=(5, None))
+                response.raise_for_status()
+            with response:
+                full_response = st.write_stream(ollama_tokens(response))
+            st.session_state.messages.append({"role": "assistant", "content": full_response})
+        except:
+            st.error("خطأ: تأكد من تشغيل Ollama في جهازك!")
\ No newline at end of file
@@ -3,8 +3,8 @@ MessageBubble component - Styled chat message bubble for PySide6.
 """
 
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QTextBrowser, QSizePolicy
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QDesktopServices
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QFont, QDesktopServices, QColor, QPainter, QPainterPath, QPixmap
 
 import markdown
 from pygments.formatters import HtmlFormatter
@@ -12,6 +12,27 @@ from pygments.formatters import HtmlFormatter
 # Pre-generate CSS for code blocks
 CODE_CSS = HtmlFormatter(style='monokai').get_style_defs('.codehilite')
 
+# Enum members resolved once instead of per bubble
+_ALIGN_USER = Qt.AlignmentFlag.AlignRight
+_ALIGN_OTHER = Qt.AlignmentFlag.AlignLeft
+
+
+def _rounded_path(rect: QRectF, tl: float, tr: float, br: float, bl: float) -> QPainterPath:
+    """Rounded rect with a separate radius per corner (like QSS border-radius)."""
+    x, y, r, b = rect.left(), rect.top(), rect.right(), rect.bottom()
+    path = QPainterPath()
+    path.moveTo(x + tl, y)
+    path.lineTo(r - tr, y)
+    path.arcTo(r - 2 * tr, y, 2 * tr, 2 * tr, 90, -90)
+    path.lineTo(r, b - br)
+    path.arcTo(r - 2 * br, b - 2 * br, 2 * br, 2 * br, 0, -90)
+    path.lineTo(x + bl, b)
+    path.arcTo(x, b - 2 * bl, 2 * bl, 2 * bl, 270, -90)
+    path.lineTo(x, y + tl)
+    path.arcTo(x, y, 2 * tl, 2 * tl, 180, -90)
+    path.closeSubpath()
+    return path
+
 class ResizingTextBrowser(QTextBrowser):
     """A QTextBrowser that automatically resizes to fit its content."""
     
@@ -45,6 +66,7 @@ class MessageBubble(QFrame):
         self.role = role
         self.is_thinking = is_thinking
         self._text = text
+        self._bg_pixmap = None  # antialiased background, re-rendered only on resize
         
         self.setObjectName("messageBubble")
         self._setup_ui()
@@ -70,24 +92,23 @@ class MessageBubble(QFrame):
     def _apply_style(self):
         is_user = self.role == "user"
         
+        # Corner radii are top-left, top-right, bottom-right, bottom-left
         if self.is_thinking:
             bg_color = "#2a2a2a"
-            border_radius = "12px"
+            self._radii = (12, 12, 12, 12)
             text_color = "#9e9e9e"
         elif is_user:
             bg_color = "#005c4b"
-            border_radius = "18px 18px 4px 18px"
+            self._radii = (18, 18, 4, 18)
             text_color = "#e8eaed"
         else:
             bg_color = "#363636"
-            border_radius = "18px 18px 18px 4px"
+            self._radii = (18, 18, 18, 4)
             text_color = "#e8eaed"
+        self._bg_color = QColor(bg_color)
         
+        # Background is painted in paintEvent from a cached pixmap
         self.setStyleSheet(f"""
-            QFrame#messageBubble {{
-                background-color: {bg_color};
-                border-radius: {border_radius};
-            }}
             QTextBrowser {{
                 color: {text_color};
             }}
@@ -97,6 +118,31 @@ class MessageBubble(QFrame):
         self.setMinimumWidth(60)
         self.setMaximumWidth(600) # Slightly wider for code
     
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bg_pixmap = None
+
+    def _background_pixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pix = self._bg_pixmap
+        if pix is None or pix.devicePixelRatio() != dpr:
+            pix = QPixmap(self.size() * dpr)
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(Qt.NoPen)
+            p.setBrush(self._bg_color)
+            p.drawPath(_rounded_path(QRectF(self.rect()), *self._radii))
+            p.end()
+            self._bg_pixmap = pix
+        return pix
+
+    def paintEvent(self, event):
+        # One blit per paint; the AA rounded shape is only rasterized on resize
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background_pixmap())
+
     def set_text(self, text: str, force_markdown: bool = True):
         """Update the message content (for streaming)."""
         self._text = text
@@ -144,4 +190,4 @@ class MessageBubble(QFrame):
         """Return the alignment for this bubble."""
         # Note: Code blocks are usually left-aligned, so bubbles with code look better left-aligned even for users?
         # But stick to standard chat UX for now.
-        return Qt.AlignRight if self.role == "user" else Qt.AlignLeft
+        return _ALIGN_USER if self.role == "user" else _ALIGN_OTHER
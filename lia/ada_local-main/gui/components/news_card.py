@@ -2,17 +2,80 @@ from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel, QWidget, QHBoxLayout
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QCursor, QFont
 
+# Category keys in match priority order (article categories are free-form AI labels)
+_CATEGORY_KEYS = ("tech", "market", "finance", "science", "culture")
+
+# Category key -> tile glyph
+_CATEGORY_ICONS = {
+    "tech": "💻",
+    "market": "📈",
+    "science": "🧬",
+    "culture": "🎭",
+}
+
+# Category key -> accent color (icon tile tint and border)
+_CATEGORY_COLORS = {
+    "tech": "#33b5e5",     # Cyan
+    "market": "#00c853",   # Green
+    "finance": "#00c853",  # Green
+    "science": "#aa66cc",  # Purple
+    "culture": "#ff4444",  # Red
+    "other": "#ffbb33",    # Orange/Yellow default
+}
+
+# One sheet for every card in the feed. Install it once on the feed container;
+# cards only carry objectNames and a "category" dynamic property.
+# We ensure background is visible against the dark window
+NEWS_CARD_QSS = """
+    QFrame#newsCard {
+        background-color: #111625; /* Slightly lighter than window #05080d */
+        border: 1px solid #1a2236;
+        border-radius: 12px;
+    }
+    QFrame#newsCard:hover {
+        background-color: #1a2236;
+        border: 1px solid #33b5e5; /* Cyan hover border */
+    }
+    QFrame#newsCard QLabel#iconArea {
+        border-radius: 10px;
+        font-size: 28px;
+    }
+    QFrame#newsCard QLabel#headline {
+        color: #ffffff; font-size: 16px; font-weight: 600; font-family: 'Segoe UI';
+    }
+    QFrame#newsCard QLabel#sourceLabel {
+        color: #33b5e5; font-weight: bold; font-size: 12px; /* Cyan accent */
+    }
+    QFrame#newsCard QLabel#dividerLabel {
+        color: #555;
+    }
+    QFrame#newsCard QLabel#timeLabel {
+        color: #8a8a8a; font-size: 12px;
+    }
+""" + "".join(
+    f"""
+    QFrame#newsCard[category="{key}"] QLabel#iconArea {{
+        background-color: {color}20;
+        border: 1px solid {color}40;
+    }}"""
+    for key, color in _CATEGORY_COLORS.items()
+)
+
+
 class NewsCard(QFrame):
     """
     A card widget representing a single news story.
-    Styling optimized for Aura Theme (Dark Navy).
+    Styling optimized for Aura Theme (Dark Navy); see NEWS_CARD_QSS.
     """
     def __init__(self, article, parent=None):
         super().__init__(parent)
         self.article = article
         self.url = article.get('url')
         
+        cat_key = self._get_category_key(article.get('category'))
+        
         self.setObjectName("newsCard")
+        self.setProperty("category", cat_key)
         self.setCursor(QCursor(Qt.PointingHandCursor))
         self.setFixedHeight(140) # Slightly more compact
         
@@ -23,16 +86,10 @@ class NewsCard(QFrame):
         
         # Image placeholder (Left side)
         self.image_area = QLabel()
+        self.image_area.setObjectName("iconArea")
         self.image_area.setFixedSize(60, 60)
         self.image_area.setAlignment(Qt.AlignCenter)
-        # Use semi-transparent background for icon
-        self.image_area.setStyleSheet(f"""
-            background-color: {self._get_category_color(article.get('category'))}20; 
-            border: 1px solid {self._get_category_color(article.get('category'))}40;
-            border-radius: 10px;
-            font-size: 28px;
-        """)
-        self.image_area.setText(self._get_category_icon(article.get('category')))
+        self.image_area.setText(_CATEGORY_ICONS.get(cat_key, "📰"))
         layout.addWidget(self.image_area)
         
         # Content (Right side)
@@ -42,9 +99,8 @@ class NewsCard(QFrame):
         
         # Headline
         headline = QLabel(article.get('title', 'No Title'))
+        headline.setObjectName("headline")
         headline.setWordWrap(True)
-        # Explicit white color for visibility
-        headline.setStyleSheet("color: #ffffff; font-size: 16px; font-weight: 600; font-family: 'Segoe UI';")
         content_layout.addWidget(headline)
         
         # Metadata Row
@@ -53,54 +109,28 @@ class NewsCard(QFrame):
         
         # Source
         source = QLabel(article.get('source', 'Unknown'))
-        source.setStyleSheet("color: #33b5e5; font-weight: bold; font-size: 12px;") # Cyan accent
+        source.setObjectName("sourceLabel")
         meta_layout.addWidget(source)
         
         # Divider
         div = QLabel("•")
-        div.setStyleSheet("color: #555;")
+        div.setObjectName("dividerLabel")
         meta_layout.addWidget(div)
         
         # Time
         date = QLabel(article.get('date', 'Just now'))
-        date.setStyleSheet("color: #8a8a8a; font-size: 12px;")
+        date.setObjectName("timeLabel")
         meta_layout.addWidget(date)
         
         meta_layout.addStretch()
         content_layout.addLayout(meta_layout)
         
         layout.addLayout(content_layout)
-        
-        # Styling using ID selector
-        # We ensure background is visible against the dark window
-        self.setStyleSheet("""
-            QFrame#newsCard {
-                background-color: #111625; /* Slightly lighter than window #05080d */
-                border: 1px solid #1a2236;
-                border-radius: 12px;
-            }
-            QFrame#newsCard:hover {
-                background-color: #1a2236;
-                border: 1px solid #33b5e5; /* Cyan hover border */
-            }
-        """)
-
-    def _get_category_color(self, category):
-        """Return color based on category."""
-        cat = str(category).lower()
-        if "tech" in cat: return "#33b5e5" # Cyan
-        if "market" in cat or "finance" in cat: return "#00c853" # Green
-        if "science" in cat: return "#aa66cc" # Purple
-        if "culture" in cat: return "#ff4444" # Red
-        return "#ffbb33" # Orange/Yellow default
 
-    def _get_category_icon(self, category):
-        cat = str(category).lower()
-        if "tech" in cat: return "💻"
-        if "market" in cat: return "📈"
-        if "science" in cat: return "🧬"
-        if "culture" in cat: return "🎭" 
-        return "📰"
+    def _get_category_key(self, category):
+        """Return the NEWS_CARD_QSS category key."""
+        cat = (category or "").lower()
+        return next((key for key in _CATEGORY_KEYS if key in cat), "other")
     
     def mousePressEvent(self, event):
         """Open URL on click."""
@@ -14,7 +14,58 @@ from qfluentwidgets.components.date_time.calendar_picker import CalendarPicker
 from qfluentwidgets.components.date_time.time_picker import TimePicker
 
 from core.calendar_manager import calendar_manager
-from datetime import datetime
+
+# Qt pattern matching calendar_manager.TIME_FORMAT
+_QT_TIME_FORMAT = "yyyy-MM-dd HH:mm:ss"
+
+# Event category (as stored from the ComboBox) -> accent color
+_EVENT_ACCENT = {
+    "WORK": "#33b5e5",
+    "PERSONAL": "#00c853",
+    "OTHER": "#aa66cc",
+}
+
+# Installed once on the timeline container; cards only set objectNames and an
+# "eventCat" dynamic property. Unknown categories are shown as OTHER.
+_TIMELINE_QSS = """
+    QWidget {
+        background: transparent;
+    }
+    QFrame#eventCard {
+        background-color: #111625;
+        border-radius: 8px;
+        border: 1px solid #1a2236;
+    }
+    QFrame#eventCard QLabel {
+        background: transparent;
+        border: none;
+    }
+    QFrame#eventCard QLabel#eventTime {
+        font-weight: bold; font-size: 13px;
+    }
+    QFrame#eventCard QLabel#eventTitle {
+        color: #e8eaed; font-weight: 500; font-size: 14px;
+    }
+    QFrame#eventCard QLabel#eventCat {
+        font-size: 10px; background: rgba(255,255,255,0.05); padding: 2px 6px; border-radius: 4px;
+    }
+    QFrame#eventCard QPushButton#eventDelete { color: #6e6e6e; background: transparent; font-size: 18px; border: none; border-radius: 12px; }
+    QFrame#eventCard QPushButton#eventDelete:hover { background: rgba(239, 83, 80, 0.2); color: #ef5350; }
+""" + "".join(
+    f"""
+    QFrame#eventCard[eventCat="{cat}"] {{
+        border-left: 3px solid {accent_color};
+    }}
+    QFrame#eventCard[eventCat="{cat}"]:hover {{
+        background-color: #1a2236;
+        border: 1px solid {accent_color};
+    }}
+    QFrame#eventCard[eventCat="{cat}"] QLabel#eventTime,
+    QFrame#eventCard[eventCat="{cat}"] QLabel#eventCat {{
+        color: {accent_color};
+    }}"""
+    for cat, accent_color in _EVENT_ACCENT.items()
+)
 
 class AddEventDialog(MessageBoxBase):
     """Custom Dialog for adding events using Fluent Widgets."""
@@ -51,6 +102,13 @@ class AddEventDialog(MessageBoxBase):
         self.cancelButton.setText("Cancel")
         
         self.widget.setMinimumWidth(350)
+    
+    def reset(self):
+        """Clear the form so the same dialog can be shown again."""
+        self.titleEdit.clear()
+        self.datePicker.setDate(QDate.currentDate())
+        self.timePicker.setTime(QTime.currentTime())
+        self.catCombo.setCurrentIndex(0)
         
     def get_data(self):
         title = self.titleEdit.text()
@@ -59,17 +117,95 @@ class AddEventDialog(MessageBoxBase):
         cat = self.catCombo.text()
         
         dt = QDateTime(date, time)
-        start = dt.toString("yyyy-MM-dd HH:mm:ss")
-        end = dt.addSecs(3600).toString("yyyy-MM-dd HH:mm:ss")
+        start = dt.toString(_QT_TIME_FORMAT)
+        end = dt.addSecs(3600).toString(_QT_TIME_FORMAT)
         
         return title, start, end, cat
 
+class EventCard(QFrame):
+    """Timeline card for one event. Recycled across refreshes via update_from()."""
+    delete_requested = Signal(str)
+    
+    # Category pill width per label text; only a handful of categories exist
+    _cat_widths = {}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.event_id = None
+        self.setObjectName("eventCard")
+        self.setCursor(Qt.PointingHandCursor)
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(15, 12, 15, 12)
+        
+        # Time
+        self.time_lbl = QLabel()
+        self.time_lbl.setObjectName("eventTime")
+        self.time_lbl.setFixedWidth(65)
+        layout.addWidget(self.time_lbl)
+        
+        # Details
+        details = QVBoxLayout()
+        details.setSpacing(4)
+        
+        self.title_lbl = QLabel()
+        self.title_lbl.setObjectName("eventTitle")
+        details.addWidget(self.title_lbl)
+        
+        self.cat_lbl = QLabel()
+        self.cat_lbl.setObjectName("eventCat")
+        details.addWidget(self.cat_lbl)
+        
+        layout.addLayout(details)
+        layout.addStretch()
+        
+        # Delete button
+        del_btn = QPushButton("×")
+        del_btn.setObjectName("eventDelete")
+        del_btn.setFixedSize(24, 24)
+        del_btn.clicked.connect(lambda: self.delete_requested.emit(self.event_id))
+        layout.addWidget(del_btn)
+    
+    def update_from(self, event):
+        """Rebind the card to another event; re-polish only if the category changes."""
+        self.event_id = event['id']
+        cat = event['category']
+        
+        style_cat = cat if cat in _EVENT_ACCENT else "OTHER"
+        if self.property("eventCat") != style_cat:
+            self.setProperty("eventCat", style_cat)
+            # Accent rules hang off the card's property, so its labels need a re-polish too
+            for w in (self, self.time_lbl, self.cat_lbl):
+                w.style().unpolish(w)
+                w.style().polish(w)
+        
+        # Time (pre-formatted by calendar_manager.get_events)
+        self.time_lbl.setText(event['_time_str'])
+        self.title_lbl.setText(event['title'])
+        self.cat_lbl.setText(cat)
+        width = self._cat_widths.get(cat)
+        if width is None:
+            width = self._cat_widths[cat] = self.cat_lbl.sizeHint().width() + 15
+        self.cat_lbl.setFixedWidth(width)
+
+class _StickyCalendarView(CalendarView):
+    """Embedded calendar: ignore the popup's own hide/close after a date is picked."""
+    
+    def hide(self):
+        pass
+    
+    def close(self):
+        return False
+
 class ScheduleComponent(QWidget):
     """Component for displaying daily schedule and calendar. Fluent Version."""
     
     def __init__(self):
         super().__init__()
         self.selected_date = QDate.currentDate()
+        self._card_pool = []  # EventCards reused across refreshes; extras are hidden
+        self._last_key = None  # What the timeline currently shows
+        self._add_dialog = None  # AddEventDialog, built on first use and reused
         self._setup_ui()
         self.refresh_events()
         
@@ -120,21 +256,24 @@ class ScheduleComponent(QWidget):
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
         self.timeline_content = QWidget()
-        self.timeline_content.setStyleSheet("background: transparent;")
+        self.timeline_content.setStyleSheet(_TIMELINE_QSS)
         self.timeline_layout = QVBoxLayout(self.timeline_content)
         self.timeline_layout.setSpacing(12)
         self.timeline_layout.addStretch()
         
+        self._empty_label = QLabel("No events scheduled")
+        self._empty_label.setAlignment(Qt.AlignCenter)
+        self._empty_label.setStyleSheet("color: #8b9bb4; padding: 20px; font-style: italic;")
+        self.timeline_layout.insertWidget(0, self._empty_label)
+        
         scroll.setWidget(self.timeline_content)
         timeline_layout.addWidget(scroll, 2) 
         
         layout.addWidget(timeline_container, 2)
         
         # --- Fluent Calendar View ---
-        self.calendar = CalendarView()
-        # Prevent auto-hide (it assumes popup behavior)
-        self.calendar.hide = lambda: None
-        self.calendar.close = lambda: None
+        # Prevent auto-hide (CalendarView assumes popup behavior)
+        self.calendar = _StickyCalendarView()
         
         # Connect date changed signal
         self.calendar.dateChanged.connect(self._on_date_selected)
@@ -150,83 +289,38 @@ class ScheduleComponent(QWidget):
         self.refresh_events()
         
     def refresh_events(self):
-        """Clear timeline and load events for selected date."""
-        while self.timeline_layout.count() > 1: # Keep stretch
-            item = self.timeline_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-                
+        """Rebind the timeline's cards to the events of the selected date."""
         date_str = self.selected_date.toString("yyyy-MM-dd")
         events = calendar_manager.get_events(date_str)
         
-        if not events:
-            empty = QLabel("No events scheduled")
-            empty.setAlignment(Qt.AlignCenter)
-            empty.setStyleSheet("color: #8b9bb4; padding: 20px; font-style: italic;")
-            self.timeline_layout.insertWidget(0, empty)
-        else:
-            for event in events:
-                self._add_event_card(event)
-
-    def _add_event_card(self, event):
-        card = QFrame()
-        card.setCursor(Qt.PointingHandCursor)
-        
-        cat = event['category']
-        accent_color = "#33b5e5" if "WORK" in cat else "#00c853" if "PERSONAL" in cat else "#aa66cc"
-        
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: #111625;
-                border-radius: 8px;
-                border: 1px solid #1a2236;
-                border-left: 3px solid {accent_color};
-            }}
-            QFrame:hover {{ 
-                background-color: #1a2236;
-                border: 1px solid {accent_color};
-            }}
-        """)
-        
-        layout = QHBoxLayout(card)
-        layout.setContentsMargins(15, 12, 15, 12)
-        
-        # Time
-        start_dt = datetime.strptime(event['start_time'], "%Y-%m-%d %H:%M:%S")
-        time_str = start_dt.strftime("%I:%M %p").lstrip("0")
-        
-        time_lbl = QLabel(time_str)
-        time_lbl.setStyleSheet(f"color: {accent_color}; font-weight: bold; font-size: 13px; background: transparent; border: none;")
-        time_lbl.setFixedWidth(65)
-        layout.addWidget(time_lbl)
-        
-        # Details
-        details = QVBoxLayout()
-        details.setSpacing(4)
-        
-        title_lbl = QLabel(event['title'])
-        title_lbl.setStyleSheet("color: #e8eaed; font-weight: 500; font-size: 14px; background: transparent; border: none;")
-        details.addWidget(title_lbl)
-        
-        cat_lbl = QLabel(cat)
-        cat_lbl.setStyleSheet(f"color: {accent_color}; font-size: 10px; background: rgba(255,255,255,0.05); padding: 2px 6px; border-radius: 4px; border: none;")
-        cat_lbl.setFixedWidth(cat_lbl.sizeHint().width() + 15)
-        details.addWidget(cat_lbl)
-        
-        layout.addLayout(details)
-        layout.addStretch()
-        
-        # Delete button
-        del_btn = QPushButton("×")
-        del_btn.setFixedSize(24, 24)
-        del_btn.setStyleSheet("""
-            QPushButton { color: #6e6e6e; background: transparent; font-size: 18px; border: none; border-radius: 12px; }
-            QPushButton:hover { background: rgba(239, 83, 80, 0.2); color: #ef5350; }
-        """)
-        del_btn.clicked.connect(lambda: self._delete_event(event['id']))
-        layout.addWidget(del_btn)
-        
-        self.timeline_layout.insertWidget(self.timeline_layout.count()-1, card)
+        # Same day, same events (e.g. re-clicking the selected date): nothing to redraw
+        key = (date_str, tuple(
+            (e['id'], e['title'], e['category'], e['start_time']) for e in events
+        ))
+        if key == self._last_key:
+            return
+        self._last_key = key
+        
+        # Batch all card changes into a single repaint of the timeline
+        self.timeline_content.setUpdatesEnabled(False)
+        try:
+            self._empty_label.setVisible(not events)
+            
+            # Grow the pool only when this day has more events than any before it
+            while len(self._card_pool) < len(events):
+                card = EventCard()
+                card.delete_requested.connect(self._delete_event)
+                self.timeline_layout.insertWidget(self.timeline_layout.count() - 1, card)
+                self._card_pool.append(card)
+            
+            for card, event in zip(self._card_pool, events):
+                card.update_from(event)
+                card.setVisible(True)
+            for card in self._card_pool[len(events):]:
+                card.setVisible(False)
+        finally:
+            self.timeline_content.setUpdatesEnabled(True)
+            self.timeline_content.update()
 
     def _delete_event(self, event_id):
         calendar_manager.delete_event(event_id)
@@ -234,7 +328,12 @@ class ScheduleComponent(QWidget):
         
     def _show_add_event_dialog(self):
         """Show dialog to create a new event."""
-        w = AddEventDialog(self.window())
+        if self._add_dialog is None:
+            self._add_dialog = AddEventDialog(self.window())
+        else:
+            self._add_dialog.reset()
+        
+        w = self._add_dialog
         if w.exec():
             title, start, end, cat = w.get_data()
             if title:
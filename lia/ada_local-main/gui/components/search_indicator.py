@@ -4,48 +4,80 @@ SearchIndicator component - Visual feedback for web search operations.
 
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, 
-    QTextEdit, QPushButton, QSizePolicy, QWidget
+    QPlainTextEdit, QPushButton, QSizePolicy, QWidget
 )
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QRectF, QPointF
-from PySide6.QtGui import QFont, QPainter, QColor
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRectF, QPointF, QTimer
+from PySide6.QtGui import QFont, QPainter, QColor, QPixmap
+
+
+# Pre-rendered spinner frames, shared by every indicator with the same look
+# (text, color, font size, device pixel ratio) -> list[QPixmap]
+_FRAME_CACHE = {}
 
 
 class RotatingSearchIcon(QWidget):
     """A widget that displays a rotating search icon."""
+    
+    FRAME_COUNT = 16
+    FRAME_INTERVAL_MS = 60  # ~1s per revolution, like the old 0->360 animation
 
     def __init__(self, text="🔍", color="#2196F3", font_size=12, parent=None):
         super().__init__(parent)
         self.setFixedSize(20, 20)
         self._text = text
         self._color = QColor(color)
+        self._font_size = font_size
         self._font = QFont("Segoe UI", font_size)
-        self._angle = 0
-        self._animation = None
+        self._frames = None
+        self._frame_idx = 0
+        self._timer = None
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
 
-    def get_angle(self):
-        return self._angle
+    def _build_frames(self):
+        """Render the glyph once per rotation step; paintEvent then only blits."""
+        dpr = self.devicePixelRatioF()
+        key = (self._text, self._color.name(), self._font_size, dpr)
+        frames = _FRAME_CACHE.get(key)
+        if frames is None:
+            w, h = self.width(), self.height()
+            rect = QRectF(-w / 2, -h / 2, w, h)
+            frames = []
+            for i in range(self.FRAME_COUNT):
+                pixmap = QPixmap(round(w * dpr), round(h * dpr))
+                pixmap.setDevicePixelRatio(dpr)
+                pixmap.fill(Qt.transparent)
+                
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.Antialiasing)
+                painter.setRenderHint(QPainter.TextAntialiasing)
+                painter.translate(w / 2, h / 2)
+                painter.rotate(i * 360 / self.FRAME_COUNT)
+                painter.setPen(self._color)
+                painter.setFont(self._font)
+                painter.drawText(rect, Qt.AlignCenter, self._text)
+                painter.end()
+                
+                frames.append(pixmap)
+            _FRAME_CACHE[key] = frames
+        return frames
 
-    def set_angle(self, angle):
-        self._angle = angle
+    def _advance_frame(self):
+        self._frame_idx = (self._frame_idx + 1) % self.FRAME_COUNT
         self.update()
 
-    angle = Property(float, get_angle, set_angle)
-
     def start_animation(self):
-        if not self._animation:
-            self._animation = QPropertyAnimation(self, b"angle", self)
-            self._animation.setDuration(1000)
-            self._animation.setStartValue(0)
-            self._animation.setEndValue(360)
-            self._animation.setLoopCount(-1)  # Infinite loop
-            self._animation.start()
+        if not self._timer:
+            self._frames = self._build_frames()
+            self._timer = QTimer(self)
+            self._timer.timeout.connect(self._advance_frame)
+            self._timer.start(self.FRAME_INTERVAL_MS)
 
     def stop_animation(self):
-        if self._animation:
-            self._animation.stop()
-            self._animation = None
-        self._angle = 0
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+        self._frames = None
+        self._frame_idx = 0
         self.update()
 
     def set_complete(self):
@@ -56,18 +88,17 @@ class RotatingSearchIcon(QWidget):
 
     def paintEvent(self, event):
         painter = QPainter(self)
+        
+        if self._frames:
+            painter.drawPixmap(0, 0, self._frames[self._frame_idx])
+            return
+        
+        # Static glyph (idle / complete)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.TextAntialiasing)
-
-        painter.translate(self.width() / 2, self.height() / 2)
-        painter.rotate(self._angle)
-        
         painter.setPen(self._color)
         painter.setFont(self._font)
-        
-        # Center the text
-        rect = QRectF(-self.width() / 2, -self.height() / 2, self.width(), self.height())
-        painter.drawText(rect, Qt.AlignCenter, self._text)
+        painter.drawText(self.rect(), Qt.AlignCenter, self._text)
 
 
 class SearchIndicator(QFrame):
@@ -80,16 +111,23 @@ class SearchIndicator(QFrame):
         self._is_expanded = True
         self._animation = None
         self._content_height = 0
+        self._shown_once = False
+        self._is_complete = False
         
         # Match MessageBubble width constraints
         self.setMaximumWidth(600)
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
         
         self._setup_ui()
-        self._apply_style()
-        
-        # Start rotating immediately
-        self.spinner.start_animation()
+        # Styling and the spinner wait for the first showEvent: most replies never search
+    
+    def showEvent(self, event):
+        if not self._shown_once:
+            self._shown_once = True
+            self._apply_style()
+            if not self._is_complete:
+                self.spinner.start_animation()
+        super().showEvent(event)
         
     def _setup_ui(self):
         self.main_layout = QVBoxLayout(self)
@@ -131,14 +169,15 @@ class SearchIndicator(QFrame):
         content_layout = QVBoxLayout(self.content_container)
         content_layout.setContentsMargins(8, 0, 8, 8)
         
-        # Search query log text
-        self.log_text = QTextEdit()
+        # Search query log text (append-only, so a plain-text document is enough)
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(200)
         self.log_text.setFont(QFont("Consolas", 9))
         self.log_text.setMinimumHeight(60)
         self.log_text.setMaximumHeight(150)
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1a2332;
                 color: #64B5F6;
                 border: none;
@@ -196,13 +235,14 @@ class SearchIndicator(QFrame):
         
     def add_query(self, query: str):
         """Add a search query to the log."""
-        self.log_text.insertPlainText(f"Query: {query}\n")
+        self.log_text.appendPlainText(f"Query: {query}")
         # Auto-scroll to bottom
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
         
     def complete(self):
         """Mark search as complete."""
+        self._is_complete = True
         self.spinner.set_complete()
         self.title_label.setText("Search Complete")
         self.title_label.setStyleSheet("color: #4CAF50; font-size: 11px;")
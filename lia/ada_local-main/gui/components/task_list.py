@@ -0,0 +1,202 @@
+"""
+Task list model/delegate - Planner task rows painted directly, no per-row widgets.
+"""
+
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QListView, QAbstractItemView, QFrame
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QEvent, QRect, QRectF, QPointF, QSize, Signal
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPixmap
+
+from qfluentwidgets import FluentIcon as FIF, SmoothScrollDelegate
+
+
+class TaskListModel(QAbstractListModel):
+    """Holds task dicts ({'id', 'text', 'completed'}) for one list view."""
+
+    IdRole = Qt.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        if role == Qt.DisplayRole:
+            return task['text']
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if task['completed'] else Qt.Unchecked
+        if role == self.IdRole:
+            return task['id']
+        return None
+
+    def task_at(self, row: int) -> dict:
+        return self._tasks[row]
+
+    def set_tasks(self, tasks: list):
+        """Replace all rows in one reset."""
+        self.beginResetModel()
+        self._tasks = list(tasks)
+        self.endResetModel()
+
+    def append_task(self, task: dict):
+        row = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tasks.append(task)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> dict:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        task = self._tasks.pop(row)
+        self.endRemoveRows()
+        return task
+
+    def set_completed(self, row: int, completed: bool):
+        """Flip a row's state in place; only that row repaints."""
+        self._tasks[row]['completed'] = completed
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
+    def take_where_completed(self, completed: bool) -> list:
+        """Remove and return (in order) every task whose state is `completed`."""
+        taken = []
+        for row in range(len(self._tasks) - 1, -1, -1):
+            if self._tasks[row]['completed'] == completed:
+                taken.append(self.remove_row(row))
+        taken.reverse()
+        return taken
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """Paints checkbox, text and delete icon for a task row and routes clicks."""
+
+    check_clicked = Signal(QModelIndex)
+    delete_clicked = Signal(QModelIndex)
+
+    ROW_HEIGHT = 50
+    MARGIN = 10
+    CHECK_SIZE = 18
+    DELETE_SIZE = 32
+    ICON_SIZE = 16
+    SPACING = 12
+
+    _ACCENT = QColor("#33b5e5")
+    _CHECK_BORDER = QPen(QColor("#8b9bb4"), 1.5)
+    _CHECK_MARK = QPen(QColor("#05080d"), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+    _TEXT_COLOR = QColor("#e8eaed")
+    _DONE_COLOR = QColor("#8a8a8a")
+    _HOVER_COLOR = QColor(51, 181, 229, 25)
+
+    # Delete icon rasterized from SVG once per device pixel ratio, shared by all rows
+    _DELETE_PIXMAPS = {}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont("Segoe UI")
+        self._font.setPixelSize(14)
+        self._done_font = QFont(self._font)
+        self._done_font.setStrikeOut(True)
+
+    @classmethod
+    def _delete_pixmap(cls, dpr: float) -> QPixmap:
+        pix = cls._DELETE_PIXMAPS.get(dpr)
+        if pix is None:
+            pix = cls._DELETE_PIXMAPS[dpr] = FIF.DELETE.icon().pixmap(QSize(cls.ICON_SIZE, cls.ICON_SIZE), dpr)
+        return pix
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)
+
+    def _check_rect(self, rect: QRect) -> QRect:
+        s = self.CHECK_SIZE
+        return QRect(rect.left() + self.MARGIN, rect.top() + (rect.height() - s) // 2, s, s)
+
+    def _delete_rect(self, rect: QRect) -> QRect:
+        s = self.DELETE_SIZE
+        return QRect(rect.right() - self.MARGIN - s, rect.top() + (rect.height() - s) // 2, s, s)
+
+    def paint(self, painter, option, index):
+        rect = option.rect
+        # Read the dict directly; cheaper than two QVariant round-trips per row
+        task = index.model().task_at(index.row())
+        done = bool(task['completed'])
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        if option.state & QStyle.State_MouseOver:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._HOVER_COLOR)
+            painter.drawRoundedRect(QRectF(rect).adjusted(2, 2, -2, -2), 6, 6)
+
+        # Checkbox
+        check = QRectF(self._check_rect(rect)).adjusted(0.75, 0.75, -0.75, -0.75)
+        if done:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._ACCENT)
+            painter.drawRoundedRect(check, 4.5, 4.5)
+            painter.setPen(self._CHECK_MARK)
+            x, y = check.left(), check.top()
+            painter.drawPolyline([QPointF(x + 4, y + 8.5), QPointF(x + 7, y + 11.5), QPointF(x + 12.5, y + 5)])
+        else:
+            painter.setPen(self._CHECK_BORDER)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRoundedRect(check, 4.5, 4.5)
+
+        # Delete icon
+        delete = self._delete_rect(rect)
+        icon_off = (self.DELETE_SIZE - self.ICON_SIZE) // 2
+        painter.drawPixmap(delete.left() + icon_off, delete.top() + icon_off,
+                           self._delete_pixmap(painter.device().devicePixelRatioF()))
+
+        # Text (strike-through when completed)
+        text_left = rect.left() + self.MARGIN + self.CHECK_SIZE + self.SPACING
+        text_rect = QRect(text_left, rect.top(), delete.left() - self.SPACING - text_left, rect.height())
+        painter.setFont(self._done_font if done else self._font)
+        painter.setPen(self._DONE_COLOR if done else self._TEXT_COLOR)
+        text = painter.fontMetrics().elidedText(task['text'], Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, text)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return False
+        if event.button() != Qt.LeftButton:
+            return False
+
+        pos = event.position().toPoint()
+        if self._check_rect(option.rect).adjusted(-4, -4, 4, 4).contains(pos):
+            target = self.check_clicked
+        elif self._delete_rect(option.rect).contains(pos):
+            target = self.delete_clicked
+        else:
+            return False
+
+        # Swallow the press so the view doesn't start a selection; act on release
+        if event.type() == QEvent.MouseButtonRelease:
+            target.emit(index)
+        return True
+
+
+class TaskListView(QListView):
+    """
+    Plain QListView for task rows. Fluent's ListView is not used because its
+    ListBase drives hover/press state through its own ListItemDelegate API
+    (setHoverRow, setPressedRow, ...), which TaskItemDelegate doesn't implement.
+    Styled by the shared QListView#taskList rule in AURA_STYLESHEET.
+    """
+
+    def __init__(self, model: TaskListModel, parent=None):
+        super().__init__(parent)
+        self.setObjectName("taskList")
+        self.setFrameShape(QFrame.NoFrame)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setUniformItemSizes(True)  # every row is ROW_HEIGHT; lets Qt skip per-row size queries
+        self.setMouseTracking(True)
+        self.scroll_delegate = SmoothScrollDelegate(self)
+        self.setModel(model)
+        self.task_delegate = TaskItemDelegate(self)
+        self.setItemDelegate(self.task_delegate)
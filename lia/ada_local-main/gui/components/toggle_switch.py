@@ -3,8 +3,21 @@ ToggleSwitch component - Custom iOS-style toggle switch for PySide6.
 """
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt, Signal, Property, QPropertyAnimation, QEasingCurve, QRectF
-from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtCore import Qt, Signal, QTimer, QEasingCurve, QRectF
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap
+
+
+def _build_track_colors(off: QColor, on: QColor, steps: int) -> list:
+    """Pre-interpolate the track color from off to on in `steps` entries."""
+    last = steps - 1
+    return [
+        QColor(
+            int(off.red() + (on.red() - off.red()) * i / last),
+            int(off.green() + (on.green() - off.green()) * i / last),
+            int(off.blue() + (on.blue() - off.blue()) * i / last),
+        )
+        for i in range(steps)
+    ]
 
 
 class ToggleSwitch(QWidget):
@@ -12,6 +25,21 @@ class ToggleSwitch(QWidget):
     
     toggled = Signal(bool)
     
+    # Track color for each thumb position step (shared by all switches)
+    _TRACK_STEPS = 64
+    _TRACK_COLORS = _build_track_colors(QColor("#3d3d3d"), QColor("#4F8EF7"), _TRACK_STEPS)
+    
+    # Antialiased track pixmaps, rasterized once per (color step, device pixel ratio)
+    _TRACK_PIXMAPS = {}
+    
+    # Paint resources built once instead of per paintEvent
+    _LABEL_PEN = QPen(QColor("#9e9e9e"))
+    _THUMB_BRUSH = QBrush(QColor("#ffffff"))
+    
+    # Slide animation: 10 frames x 15ms (~150ms), OutCubic progress sampled once
+    _ANIM_INTERVAL_MS = 15
+    _ANIM_PROGRESS = [QEasingCurve(QEasingCurve.OutCubic).valueForProgress((i + 1) / 10) for i in range(10)]
+    
     def __init__(self, label: str = "", checked: bool = False, parent=None):
         super().__init__(parent)
         self._checked = checked
@@ -21,18 +49,11 @@ class ToggleSwitch(QWidget):
         self.setFixedSize(80 if label else 50, 28)
         self.setCursor(Qt.PointingHandCursor)
         
-        self._animation = QPropertyAnimation(self, b"thumb_position")
-        self._animation.setDuration(150)
-        self._animation.setEasingCurve(QEasingCurve.OutCubic)
-    
-    def get_thumb_position(self):
-        return self._thumb_position
-    
-    def set_thumb_position(self, pos):
-        self._thumb_position = pos
-        self.update()
-    
-    thumb_position = Property(float, get_thumb_position, set_thumb_position)
+        self._frames = []
+        self._frame_idx = 0
+        self._anim_timer = QTimer(self)
+        self._anim_timer.setInterval(self._ANIM_INTERVAL_MS)
+        self._anim_timer.timeout.connect(self._next_frame)
     
     def isChecked(self):
         return self._checked
@@ -44,18 +65,45 @@ class ToggleSwitch(QWidget):
             self.toggled.emit(self._checked)
     
     def _animate_thumb(self):
-        self._animation.stop()
-        self._animation.setStartValue(self._thumb_position)
-        self._animation.setEndValue(1.0 if self._checked else 0.0)
-        self._animation.start()
+        start = self._thumb_position
+        end = 1.0 if self._checked else 0.0
+        self._frames = [start + (end - start) * p for p in self._ANIM_PROGRESS]
+        self._frame_idx = 0
+        self._anim_timer.start()
+    
+    def _next_frame(self):
+        self._thumb_position = self._frames[self._frame_idx]
+        self._frame_idx += 1
+        if self._frame_idx >= len(self._frames):
+            self._anim_timer.stop()
+        self.update()
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.setChecked(not self._checked)
     
+    def _track_pixmap(self, step: int, width: int, height: int) -> QPixmap:
+        """Return the antialiased rounded track for a color step, rendering it on first use."""
+        dpr = self.devicePixelRatioF()
+        key = (step, dpr)
+        pixmap = self._TRACK_PIXMAPS.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(width * dpr), round(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            
+            p = QPainter(pixmap)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setBrush(self._TRACK_COLORS[step])
+            p.setPen(Qt.NoPen)
+            p.drawRoundedRect(QRectF(0, 0, width, height), height / 2, height / 2)
+            p.end()
+            
+            self._TRACK_PIXMAPS[key] = pixmap
+        return pixmap
+    
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         # Dimensions
         track_width = 44
@@ -66,29 +114,19 @@ class ToggleSwitch(QWidget):
         # Draw label if present
         label_offset = 0
         if self._label:
-            painter.setPen(QColor("#9e9e9e"))
+            painter.setPen(self._LABEL_PEN)
             painter.drawText(0, 0, 30, 28, Qt.AlignVCenter | Qt.AlignLeft, self._label)
             label_offset = 35
         
-        # Track colors
-        track_off_color = QColor("#3d3d3d")
-        track_on_color = QColor("#4F8EF7")
-        
-        # Interpolate color based on position
-        r = int(track_off_color.red() + (track_on_color.red() - track_off_color.red()) * self._thumb_position)
-        g = int(track_off_color.green() + (track_on_color.green() - track_off_color.green()) * self._thumb_position)
-        b = int(track_off_color.blue() + (track_on_color.blue() - track_off_color.blue()) * self._thumb_position)
-        track_color = QColor(r, g, b)
+        # Draw track: blit the cached pixmap for the current color step (no per-frame AA fill)
+        step = int(self._thumb_position * (self._TRACK_STEPS - 1))
+        painter.drawPixmap(label_offset, 2, self._track_pixmap(step, track_width, track_height))
         
-        # Draw track
-        track_rect = QRectF(label_offset, 2, track_width, track_height)
-        painter.setBrush(track_color)
+        # Draw thumb (the only shape that is rasterized with AA every frame)
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(track_rect, track_height / 2, track_height / 2)
-        
-        # Draw thumb
         thumb_x = label_offset + padding + (track_width - thumb_size - padding * 2) * self._thumb_position
         thumb_y = 2 + padding
         thumb_rect = QRectF(thumb_x, thumb_y, thumb_size, thumb_size)
-        painter.setBrush(QColor("#ffffff"))
+        painter.setBrush(self._THUMB_BRUSH)
         painter.drawEllipse(thumb_rect)
@@ -2,14 +2,22 @@
 Voice Listening Indicator - Visual cue when wake word is detected and AI is listening.
 """
 
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QGraphicsOpacityEffect
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QSize, QPoint
-from PySide6.QtGui import QFont, QPainter, QColor, QBrush, QPen
+import math
+
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QSize, QPoint, QRect
+from PySide6.QtGui import QFont, QPainter, QColor, QBrush, QPen, QPixmap
 
 
 class VoiceIndicator(QWidget):
     """Animated voice listening indicator that appears when wake word is detected."""
     
+    BASE_SIZE = 80        # Main circle diameter
+    PULSE_GROWTH = 40     # Pulse ring grows from BASE_SIZE to BASE_SIZE + PULSE_GROWTH
+    PULSE_PEN_WIDTH = 3
+    PULSE_PERIOD_MS = 1500
+    PULSE_INTERVAL_MS = 33  # ~30 fps is plenty for a slow 1.5s pulse
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool | Qt.WindowStaysOnTopHint)
@@ -17,8 +25,8 @@ class VoiceIndicator(QWidget):
         self.setAttribute(Qt.WA_ShowWithoutActivating)
         
         self.is_listening = False
-        self.pulse_animation = None
-        self.opacity_effect = None
+        self.pulse_timer = None
+        self._core_pixmap = None  # Main circle + dot, rendered once per device pixel ratio
         
         self._setup_ui()
         self._setup_animations()
@@ -60,93 +68,131 @@ class VoiceIndicator(QWidget):
     
     def _setup_animations(self):
         """Setup pulse and fade animations."""
-        # Opacity effect for fade in/out
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.opacity_effect)
-        self.opacity_effect.setOpacity(0)
+        # Fade in/out via window opacity: we are a top-level Tool window, so no
+        # QGraphicsOpacityEffect (and its offscreen composite pass) is needed
+        self.setWindowOpacity(0.0)
         
         # Fade in animation
-        self.fade_in = QPropertyAnimation(self.opacity_effect, b"opacity")
+        self.fade_in = QPropertyAnimation(self, b"windowOpacity")
         self.fade_in.setDuration(300)
-        self.fade_in.setStartValue(0)
-        self.fade_in.setEndValue(1)
+        self.fade_in.setStartValue(0.0)
+        self.fade_in.setEndValue(1.0)
         self.fade_in.setEasingCurve(QEasingCurve.OutCubic)
         
         # Fade out animation
-        self.fade_out = QPropertyAnimation(self.opacity_effect, b"opacity")
+        self.fade_out = QPropertyAnimation(self, b"windowOpacity")
         self.fade_out.setDuration(300)
-        self.fade_out.setStartValue(1)
-        self.fade_out.setEndValue(0)
+        self.fade_out.setStartValue(1.0)
+        self.fade_out.setEndValue(0.0)
         self.fade_out.setEasingCurve(QEasingCurve.InCubic)
         self.fade_out.finished.connect(self._on_fade_out_finished)
         
-        # Pulse animation for the circle
+        # Paint resources, built once; only the pulse alpha changes per frame
+        self._main_color = QColor(51, 181, 229, 200)  # #33b5e5 with some transparency
+        self._inner_color = QColor(51, 181, 229, 255)
+        self._main_pen = QPen(self._main_color, 4)
+        self._main_brush = QBrush(self._main_color, Qt.SolidPattern)
+        self._inner_brush = QBrush(self._inner_color, Qt.SolidPattern)
+        self._pulse_color = QColor(51, 181, 229, 0)  # #33b5e5 with alpha
+        self._pulse_pen = QPen(self._pulse_color, self.PULSE_PEN_WIDTH)
+        self._center_point = QPoint(self.width() // 2, self.container.height() // 2)
+        radius = (self.BASE_SIZE + self.PULSE_GROWTH) // 2 + self.PULSE_PEN_WIDTH
+        self._pulse_bounds = QRect(
+            self._center_point.x() - radius, self._center_point.y() - radius, radius * 2, radius * 2
+        )
+        
+        # Pulse animation for the circle: a frame-limited timer stepping a looping phase
         self.pulse_value = 0.0
-        self.pulse_animation = QPropertyAnimation(self, b"pulseValue")
-        self.pulse_animation.setDuration(1500)
-        self.pulse_animation.setStartValue(0.0)
-        self.pulse_animation.setEndValue(1.0)
-        self.pulse_animation.setLoopCount(-1)  # Infinite loop
-        self.pulse_animation.setEasingCurve(QEasingCurve.InOutSine)
+        self._pulse_phase = 0.0
+        self.pulse_timer = QTimer(self)
+        self.pulse_timer.setTimerType(Qt.PreciseTimer)
+        self.pulse_timer.setInterval(self.PULSE_INTERVAL_MS)
+        self.pulse_timer.timeout.connect(self._advance_pulse)
     
     def paintEvent(self, event):
         """Custom paint event to draw animated pulsing circle."""
-        if not self.is_listening:
+        if not self.is_listening or not self.isVisible():
             return
         
         painter = QPainter(self)
+        # Pulse ticks only invalidate the ring's rect; don't fill anything outside it
+        painter.setClipRegion(event.region())
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Calculate pulse size
-        base_size = 80
-        pulse_size = base_size + (self.pulse_value * 40)  # Pulse from 80 to 120
-        
-        # Calculate center
-        center_x = self.width() // 2
-        center_y = self.container.height() // 2
+        center = self._center()
+        self._draw_pulse_ring(painter, center)
         
-        # Draw outer pulse ring (fading)
-        pulse_alpha = int(255 * (1 - self.pulse_value))
-        pulse_color = QColor(51, 181, 229, pulse_alpha)  # #33b5e5 with alpha
-        painter.setPen(QPen(pulse_color, 3))
+        core = self._get_core_pixmap()
+        half = core.width() / core.devicePixelRatio() / 2
+        painter.drawPixmap(int(center.x() - half), int(center.y() - half), core)
+    
+    def _center(self) -> QPoint:
+        return self._center_point
+    
+    def _pulse_rect(self) -> QRect:
+        """Bounding rect of the pulse ring at its largest, including the pen."""
+        return self._pulse_bounds
+    
+    def _draw_pulse_ring(self, painter, center):
+        """Draw outer pulse ring (fading)."""
+        pulse_size = self.BASE_SIZE + (self.pulse_value * self.PULSE_GROWTH)  # Pulse from 80 to 120
+        self._pulse_color.setAlpha(int(255 * (1 - self.pulse_value)))
+        self._pulse_pen.setColor(self._pulse_color)
+        painter.setPen(self._pulse_pen)
         painter.setBrush(Qt.NoBrush)
         painter.drawEllipse(
-            QPoint(center_x, center_y),
+            center,
             int(pulse_size // 2),
             int(pulse_size // 2)
         )
-        
+    
+    def _get_core_pixmap(self) -> QPixmap:
+        """Return the cached core pixmap, re-rendering only if the device pixel ratio changed."""
+        dpr = self.devicePixelRatioF()
+        if self._core_pixmap is None or self._core_pixmap.devicePixelRatio() != dpr:
+            # Circle diameter plus the full 4px pen width (half the pen on each side)
+            size = self.BASE_SIZE + 4
+            pixmap = QPixmap(round(size * dpr), round(size * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._draw_static_core(painter, QPoint(size // 2, size // 2))
+            painter.end()
+            
+            self._core_pixmap = pixmap
+        return self._core_pixmap
+    
+    def _draw_static_core(self, painter, center):
+        """Draw the main circle and inner dot; identical on every frame."""
         # Draw main circle (solid)
-        main_color = QColor(51, 181, 229, 200)  # #33b5e5 with some transparency
-        painter.setPen(QPen(main_color, 4))
-        painter.setBrush(QBrush(main_color, Qt.SolidPattern))
+        painter.setPen(self._main_pen)
+        painter.setBrush(self._main_brush)
         painter.drawEllipse(
-            QPoint(center_x, center_y),
-            int(base_size // 2),
-            int(base_size // 2)
+            center,
+            int(self.BASE_SIZE // 2),
+            int(self.BASE_SIZE // 2)
         )
         
         # Draw inner dot (microphone icon representation)
-        inner_color = QColor(51, 181, 229, 255)
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(inner_color, Qt.SolidPattern))
+        painter.setBrush(self._inner_brush)
         painter.drawEllipse(
-            QPoint(center_x, center_y),
+            center,
             8,
             8
         )
     
-    def get_pulse_value(self):
-        """Getter for pulse animation property."""
-        return self.pulse_value
+    def _advance_pulse(self):
+        """Step the pulse phase (0 -> 1, then loop) with an InOutSine ease."""
+        self._pulse_phase = (self._pulse_phase + self.PULSE_INTERVAL_MS / self.PULSE_PERIOD_MS) % 1.0
+        self.set_pulse_value(0.5 - 0.5 * math.cos(math.pi * self._pulse_phase))
     
     def set_pulse_value(self, value):
-        """Setter for pulse animation property."""
+        """Set the pulse amount (0..1) and repaint the ring."""
         self.pulse_value = value
-        self.update()  # Trigger repaint
-    
-    # Create property for animation
-    pulseValue = property(get_pulse_value, set_pulse_value)
+        self.update(self._pulse_rect())  # Queue a repaint of the ring area only
     
     def show_listening(self):
         """Show the listening indicator."""
@@ -159,10 +205,13 @@ class VoiceIndicator(QWidget):
         self.is_listening = True
         self._position_window()
         print(f"[VoiceIndicator] Showing widget and starting animations")
+        self.fade_out.stop()  # A pending fade-out must not hide us again
+        self.setUpdatesEnabled(True)
         self.show()
         self.fade_in.start()
-        if self.pulse_animation:
-            self.pulse_animation.start()
+        if self.pulse_timer and not self.pulse_timer.isActive():
+            self._pulse_phase = 0.0
+            self.pulse_timer.start()
         print(f"[VoiceIndicator] ✓ Indicator should now be visible")
     
     def hide_listening(self, delay_ms: int = 500):
@@ -182,13 +231,17 @@ class VoiceIndicator(QWidget):
             return
         
         self.is_listening = False
-        if self.pulse_animation:
-            self.pulse_animation.stop()
+        if self.pulse_timer:
+            self.pulse_timer.stop()
         self.fade_out.start()
     
     def _on_fade_out_finished(self):
         """Called when fade out animation completes."""
+        if self.pulse_timer:
+            self.pulse_timer.stop()
         self.hide()
+        # Idle: no paints at all until show_listening() re-enables updates
+        self.setUpdatesEnabled(False)
         self.pulse_value = 0.0
     
     def _position_window(self):
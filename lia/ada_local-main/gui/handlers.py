@@ -404,7 +404,11 @@ class ChatHandlers(QObject):
         """Called when generation starts, with thinking mode flag."""
         self.streaming_state['thinking_enabled'] = thinking_enabled
         if thinking_enabled and self.streaming_state['thinking_ui']:
-            self.streaming_state['thinking_ui'].setVisible(True)
+            thinking_ui = self.streaming_state['thinking_ui']
+            self.main_window.promote_thinking(self.streaming_state['response_bubble'])
+            # Only show it once it sits in the chat row; unparented it would open as its own window
+            if thinking_ui.parentWidget() is not None:
+                thinking_ui.setVisible(True)
         self.ui_throttle_timer.start()
 
     def _on_thought_chunk(self, text):
@@ -487,8 +491,11 @@ class ChatHandlers(QObject):
     def _on_search_start(self, query: str):
         """Called when web search starts."""
         if self.streaming_state['search_indicator']:
-            self.streaming_state['search_indicator'].add_query(query)
-            self.streaming_state['search_indicator'].setVisible(True)
+            search_indicator = self.streaming_state['search_indicator']
+            self.main_window.promote_search(self.streaming_state['response_bubble'])
+            search_indicator.add_query(query)
+            if search_indicator.parentWidget() is not None:
+                search_indicator.setVisible(True)
     
     def _on_search_end(self):
         """Called when web search completes."""
@@ -48,6 +48,12 @@ QWidget#chatContent, QWidget#plannerPanel, QWidget#briefingView, QFrame#homeAuto
     background-color: transparent;
 }
 
+/* Planner task lists (plain QListView painted by TaskItemDelegate) */
+QListView#taskList {
+    background: transparent;
+    border: none;
+}
+
 /* List Items (Session List) */
 ListWidget {
     background-color: transparent;
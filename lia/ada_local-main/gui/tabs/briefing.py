@@ -2,7 +2,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
 )
 from PySide6.QtCore import Qt, QThread, Signal
-from gui.components.news_card import NewsCard
+from gui.components.news_card import NewsCard, NEWS_CARD_QSS
 from core.news import news_manager
 
 from qfluentwidgets import (
@@ -87,22 +87,27 @@ class BriefingView(QWidget):
         self.layout.addWidget(self.pivot)
         
         # News Grid (Scroll Area)
-        scroll = ScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("background: transparent; border: none;")
-        scroll.viewport().setStyleSheet("background: transparent;")
+        self.scroll = ScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.scroll.setStyleSheet("background: transparent; border: none;")
+        self.scroll.viewport().setStyleSheet("background: transparent;")
+        self.layout.addWidget(self.scroll)
         
+        # Load Data (No AI on startup to prevent model load); this also builds the feed container
+        self.load_news(use_ai=False)
+
+    def _reset_feed(self):
+        """Swap in an empty feed container.
+        QScrollArea deletes the old one, and every card in it, in a single pass."""
         container = QWidget()
+        # Card styling is parsed once per feed instead of per NewsCard
+        container.setStyleSheet(NEWS_CARD_QSS)
         self.news_list_layout = QVBoxLayout(container)
         self.news_list_layout.setSpacing(15)
         self.news_list_layout.setContentsMargins(0, 0, 0, 20)
         self.news_list_layout.setAlignment(Qt.AlignTop)
         
-        scroll.setWidget(container)
-        self.layout.addWidget(scroll)
-        
-        # Load Data (No AI on startup to prevent model load)
-        self.load_news(use_ai=False)
+        self.scroll.setWidget(container)
 
     def load_news(self, use_ai=True):
         if use_ai:
@@ -111,10 +116,7 @@ class BriefingView(QWidget):
             self.bk_text.setText("Fetching latest headlines...")
         
         # Clear list
-        while self.news_list_layout.count():
-            item = self.news_list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._reset_feed()
             
         self.thread = NewsLoaderThread(use_ai=use_ai)
         self.thread.status_update.connect(self.bk_text.setText)
@@ -1,8 +1,8 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFrame, QLabel, 
-    QListWidgetItem, QSizePolicy, QMenu
+    QListWidgetItem, QSizePolicy, QMenu, QInputDialog
 )
-from PySide6.QtCore import Qt, QSize, QTimer, Signal
+from PySide6.QtCore import Qt, QSize, QTimer, QMetaObject, Signal, Slot
 from PySide6.QtGui import QFont, QIcon, QColor
 
 from qfluentwidgets import (
@@ -16,6 +16,55 @@ from gui.components import ThinkingExpander
 # We will replace local ToggleSwitch with qfluentwidgets.SwitchButton
 from core.history import history_manager
 
+# Looked up once; PySide6 enum attribute access is not free in hot paths
+_SESSION_ID_ROLE = Qt.ItemDataRole.UserRole
+
+# One sheet for the whole tab, scoped by objectName, instead of an inline
+# setStyleSheet() per widget (each of which restyles its whole subtree).
+_CHAT_QSS = """
+QFrame#sidebar {
+    background-color: transparent;
+    border-right: 1px solid rgba(255, 255, 255, 0.05);
+}
+QFrame#chatContent, QWidget#chatViewport, QWidget#chatContainer, QWidget#chatRow {
+    background: transparent;
+}
+QWidget#inputBar {
+    background-color: transparent;
+    border-top: 1px solid rgba(255, 255, 255, 0.05);
+}
+ScrollArea#chatScroll {
+    background: transparent;
+    border: none;
+}
+QLabel#statusLabel {
+    color: #8a8a8a;
+    font-size: 12px;
+}
+"""
+
+# QIcons are built on first use (needs a QApplication) and reused per item.
+_SESSION_ICONS = {}
+
+
+def _session_icon(pinned: bool) -> QIcon:
+    icon = _SESSION_ICONS.get(pinned)
+    if icon is None:
+        icon = _SESSION_ICONS[pinned] = (FIF.PIN if pinned else FIF.CHAT).icon()
+    return icon
+
+
+class _SessionListWidget(ListWidget):
+    """Session list that hands right-clicks straight to its ChatTab."""
+
+    def __init__(self, chat_tab):
+        super().__init__()
+        self._chat_tab = chat_tab
+
+    def contextMenuEvent(self, event):
+        # event.pos() is in viewport coordinates, same as customContextMenuRequested
+        self._chat_tab._show_session_context_menu(event.pos())
+
 
 class ChatTab(QWidget):
     """
@@ -35,10 +84,27 @@ class ChatTab(QWidget):
     session_rename_requested = Signal(str, str)
     session_delete_requested = Signal(str)
 
+    # Only this many chat rows are kept as live widgets; older messages are
+    # stored as (role, text, is_thinking) and re-realized a page at a time
+    # when the user scrolls to the top.
+    MAX_REALIZED_MESSAGES = 50
+    HISTORY_PAGE = 20
+
     def __init__(self):
         super().__init__()
         self.setObjectName("ChatTab")
+        self.setStyleSheet(_CHAT_QSS)
+        # session id -> (item, pinned); lets refresh_sidebar diff instead of rebuild
+        self._session_items = {}
+        self._pending_messages = []   # added but not yet realized
+        self._history_backlog = []    # older than every realized row, oldest first
+        self._realize_queued = False
+        self._scroll_anchor = None    # distance from bottom to keep after paging in
+        self._scroll_pending = False
+        # response bubble -> [row layout, thinking_ui, search_indicator] not yet inserted
+        self._unpromoted = {}
         self._setup_ui()
+        self._build_session_menu()
         self._connect_internal_signals()
 
     def _setup_ui(self):
@@ -50,7 +116,6 @@ class ChatTab(QWidget):
         self.sidebar = QFrame()
         self.sidebar.setObjectName("sidebar")
         self.sidebar.setFixedWidth(300)
-        self.sidebar.setStyleSheet("background-color: transparent; border-right: 1px solid rgba(255, 255, 255, 0.05);")
         
         sidebar_layout = QVBoxLayout(self.sidebar)
         sidebar_layout.setContentsMargins(10, 10, 10, 10)
@@ -61,9 +126,7 @@ class ChatTab(QWidget):
         sidebar_layout.addWidget(self.new_chat_btn)
 
         # Session List
-        self.session_list = ListWidget()
-        self.session_list.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.session_list.customContextMenuRequested.connect(self._show_session_context_menu)
+        self.session_list = _SessionListWidget(self)
         # Transparent background for list
         self.session_list.setStyleSheet("background: transparent; border: none;")
         sidebar_layout.addWidget(self.session_list)
@@ -73,19 +136,19 @@ class ChatTab(QWidget):
         # --- Chat Content Area ---
         self.chat_content = QFrame()
         self.chat_content.setObjectName("chatContent")
-        self.chat_content.setStyleSheet("background-color: transparent;")
         chat_layout = QVBoxLayout(self.chat_content)
         chat_layout.setContentsMargins(0, 0, 0, 0)
         chat_layout.setSpacing(0)
 
         # Header (Status + Toggle)
-        header = QFrame()
+        header = QWidget()
+        header.setObjectName("chatHeader")
         header.setFixedHeight(50)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(20, 0, 20, 0)
 
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #8a8a8a; font-size: 12px;")
+        self.status_label.setObjectName("statusLabel")
         header_layout.addWidget(self.status_label)
         
         header_layout.addStretch()
@@ -101,12 +164,12 @@ class ChatTab(QWidget):
         # Chat Scroll Area
         self.chat_scroll = ScrollArea()
         self.chat_scroll.setWidgetResizable(True)
-        self.chat_scroll.setStyleSheet("background: transparent; border: none;")
+        self.chat_scroll.setObjectName("chatScroll")
         # Remove white background of scroll view
-        self.chat_scroll.viewport().setStyleSheet("background: transparent;")
+        self.chat_scroll.viewport().setObjectName("chatViewport")
 
         self.chat_container = QWidget()
-        self.chat_container.setStyleSheet("background: transparent;")
+        self.chat_container.setObjectName("chatContainer")
         self.chat_container_layout = QVBoxLayout(self.chat_container)
         self.chat_container_layout.setContentsMargins(20, 10, 20, 10)
         self.chat_container_layout.setSpacing(15)
@@ -116,9 +179,10 @@ class ChatTab(QWidget):
         chat_layout.addWidget(self.chat_scroll)
 
         # Input Bar
-        input_bar = QFrame()
+        input_bar = QWidget()
+        input_bar.setObjectName("inputBar")
+        input_bar.setAttribute(Qt.WA_StyledBackground, True)  # paint the border from _CHAT_QSS
         input_bar.setFixedHeight(80)
-        input_bar.setStyleSheet("background-color: transparent; border-top: 1px solid rgba(255, 255, 255, 0.05);")
         
         input_layout = QHBoxLayout(input_bar)
         input_layout.setContentsMargins(20, 10, 20, 20)
@@ -137,6 +201,7 @@ class ChatTab(QWidget):
 
         self.send_btn = PrimaryPushButton(FIF.SEND, "Send")
         self.send_btn.setFixedWidth(100)
+        self.send_btn.setEnabled(False)
         input_layout.addWidget(self.send_btn)
 
         chat_layout.addWidget(input_bar)
@@ -148,25 +213,35 @@ class ChatTab(QWidget):
         self.new_chat_btn.clicked.connect(self.new_chat_requested.emit)
         self.send_btn.clicked.connect(self._on_send_clicked)
         self.user_input.returnPressed.connect(self._on_send_clicked)
+        self.user_input.textChanged.connect(self._on_input_changed)
         self.stop_btn.clicked.connect(self.stop_generation_requested.emit)
         self.tts_toggle.checkedChanged.connect(self.tts_toggled.emit)
         self.session_list.itemClicked.connect(self._on_session_clicked)
+        scrollbar = self.chat_scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._on_chat_scrolled)
+        scrollbar.rangeChanged.connect(self._on_chat_range_changed)
 
     def _on_send_clicked(self):
-        text = self.user_input.text()
-        if text.strip():
+        # send_btn tracks whether the input has any non-blank text
+        if not self.send_btn.isEnabled():
+            return
+        text = self.user_input.text().strip()
+        if text:
             self.send_message_requested.emit(text)
 
+    def _on_input_changed(self, text: str):
+        self.send_btn.setEnabled(bool(text.strip()))
+
     def _on_session_clicked(self, item: QListWidgetItem):
-        session_id = item.data(Qt.UserRole)
+        session_id = item.data(_SESSION_ID_ROLE)
         if session_id:
             self.session_selected.emit(session_id)
 
     # --- Public API for Controller/MainWindow ---
 
     def set_status(self, text: str):
-        """Update status label."""
-        QTimer.singleShot(0, lambda: self.status_label.setText(text))
+        """Update status label (always called on the GUI thread)."""
+        self.status_label.setText(text)
 
     def clear_input(self):
         self.user_input.clear()
@@ -178,110 +253,217 @@ class ChatTab(QWidget):
          self.user_input.setEnabled(not is_generating)
          if not is_generating:
              self.user_input.setFocus()
+             # The streamed row is final now; it can be trimmed like any other
+             self._unpromoted = {}
 
     def add_message_bubble(self, role: str, text: str, is_thinking: bool = False):
         """Add a bubble."""
-        # Note: MessageBubble might need updates to look good on transparent background
-        bubble = MessageBubble(role, text, is_thinking)
-        
-        wrapper = QWidget()
-        wrapper.setStyleSheet("background: transparent;")
-        wrapper_layout = QHBoxLayout(wrapper)
-        wrapper_layout.setContentsMargins(0, 0, 0, 0)
-        
-        if role == "user":
-            wrapper_layout.addStretch()
-            wrapper_layout.addWidget(bubble)
-        else:
-            wrapper_layout.addWidget(bubble)
-            wrapper_layout.addStretch()
-        
-        # Insert before stretch (last item)
-        count = self.chat_container_layout.count()
-        self.chat_container_layout.insertWidget(count - 1, wrapper)
-        
-        QTimer.singleShot(50, self.scroll_to_bottom)
+        # Realized on the next event loop turn so a burst (loading a long
+        # session) only builds the widgets that stay in the window.
+        self._pending_messages.append((role, text, is_thinking))
+        if not self._realize_queued:
+            self._realize_queued = True
+            QMetaObject.invokeMethod(self, "_realize_pending", Qt.QueuedConnection)
 
     def add_streaming_widgets(self, thinking_ui, search_indicator, response_bubble):
         """Add streaming widgets."""
+        self._realize_pending()  # keep the user's message above the response
+
         wrapper = QWidget()
-        wrapper.setStyleSheet("background: transparent;")
+        wrapper.setObjectName("chatRow")
         wrapper_layout = QVBoxLayout(wrapper)
         wrapper_layout.setContentsMargins(0, 0, 0, 0)
         wrapper_layout.setSpacing(8)
-        
-        wrapper_layout.addWidget(thinking_ui)
-        wrapper_layout.addWidget(search_indicator)
-        
-        bubble_wrapper = QWidget()
-        bubble_wrapper.setStyleSheet("background: transparent;")
-        bubble_layout = QHBoxLayout(bubble_wrapper)
-        bubble_layout.setContentsMargins(0, 0, 0, 0)
-        bubble_layout.addWidget(response_bubble)
-        bubble_layout.addStretch()
-        wrapper_layout.addWidget(bubble_wrapper)
-        
+
+        # Thinking/search widgets join the row only once they get content
+        wrapper_layout.addWidget(response_bubble, 0, response_bubble.alignment)
+        self._unpromoted = {response_bubble: [wrapper_layout, thinking_ui, search_indicator]}
+
         count = self.chat_container_layout.count()
         self.chat_container_layout.insertWidget(count - 1, wrapper)
-        
-        QTimer.singleShot(50, self.scroll_to_bottom)
+        self._trim_history()
+
+        self._request_scroll_to_bottom()
+
+    def promote_thinking(self, response_bubble):
+        """Insert the thinking widget above its response on first use."""
+        entry = self._unpromoted.get(response_bubble)
+        if entry and entry[1] is not None:
+            entry[0].insertWidget(0, entry[1])
+            entry[1] = None
+
+    def promote_search(self, response_bubble):
+        """Insert the search indicator just above its response on first use."""
+        entry = self._unpromoted.get(response_bubble)
+        if entry and entry[2] is not None:
+            row = entry[0]
+            row.insertWidget(row.indexOf(response_bubble), entry[2])
+            entry[2] = None
 
     def clear_chat_display(self):
         """Clear chat."""
+        self._pending_messages.clear()
+        self._history_backlog.clear()
+        self._scroll_anchor = None
+        self._unpromoted = {}
         # Keep only the last stretch item
         while self.chat_container_layout.count() > 1:
             item = self.chat_container_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
 
+    def _insert_bubble(self, index: int, role: str, text: str, is_thinking: bool):
+        # Note: MessageBubble might need updates to look good on transparent background
+        bubble = MessageBubble(role, text, is_thinking)
+        # The layout aligns the bubble itself, so no wrapper widget/row layout is needed.
+        self.chat_container_layout.insertWidget(index, bubble, 0, bubble.alignment)
+
+    @Slot()
+    def _realize_pending(self):
+        self._realize_queued = False
+        pending, self._pending_messages = self._pending_messages, []
+        if not pending:
+            return
+
+        keep = self.MAX_REALIZED_MESSAGES
+        # A live streaming row can't be trimmed, so the overflow wouldn't be older than it
+        if len(pending) > keep and not self._unpromoted:
+            # Everything on screen is now older than the overflow
+            self._trim_history(0)
+            self._history_backlog.extend(pending[:-keep])
+            pending = pending[-keep:]
+
+        for record in pending:
+            self._insert_bubble(self.chat_container_layout.count() - 1, *record)
+        self._trim_history()
+
+        self._request_scroll_to_bottom()
+
+    def _trim_history(self, limit: int = None):
+        """Turn the oldest rows back into backlog records beyond `limit`."""
+        if limit is None:
+            limit = self.MAX_REALIZED_MESSAGES
+        layout = self.chat_container_layout
+        while layout.count() - 1 > limit:
+            widget = layout.itemAt(0).widget()
+            # A finished streaming row is kept as its response, like a reload would show it
+            bubble = widget if isinstance(widget, MessageBubble) else widget.findChild(MessageBubble)
+            # Never drop the row that is still streaming (or anything after it)
+            if bubble is None or bubble in self._unpromoted:
+                break
+            layout.takeAt(0)
+            widget.deleteLater()
+            self._history_backlog.append((bubble.role, bubble._text, bubble.is_thinking))
+
+    def _on_chat_scrolled(self, value: int):
+        if value != 0 or not self._history_backlog or self._pending_messages:
+            return
+        page = self._history_backlog[-self.HISTORY_PAGE:]
+        del self._history_backlog[-self.HISTORY_PAGE:]
+
+        scrollbar = self.chat_scroll.verticalScrollBar()
+        self._scroll_anchor = scrollbar.maximum() - value
+        for index, record in enumerate(page):
+            self._insert_bubble(index, *record)
+
+    def _on_chat_range_changed(self, _minimum: int, maximum: int):
+        # Keep the view on the same message after a page is inserted above it
+        if self._scroll_anchor is not None:
+            self.chat_scroll.verticalScrollBar().setValue(maximum - self._scroll_anchor)
+            self._scroll_anchor = None
+
     def scroll_to_bottom(self):
         scrollbar = self.chat_scroll.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def _request_scroll_to_bottom(self):
+        """Queue one scroll for however many rows are added this turn."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QMetaObject.invokeMethod(self, "_do_scroll_to_bottom", Qt.QueuedConnection)
+
+    @Slot()
+    def _do_scroll_to_bottom(self):
+        self._scroll_pending = False
+        self.scroll_to_bottom()
+
     def refresh_sidebar(self, current_session_id: str = None):
-        """Refresh sidebar list."""
-        self.session_list.clear()
+        """Refresh sidebar list, touching only sessions that changed."""
         sessions = history_manager.get_sessions()
-        
-        for sess in sessions:
-            title = sess['title']
-            sid = sess['id']
-            is_pinned = sess.get('pinned', False)
-            is_current = sid == current_session_id
-            
-            # Use standard QListWidgetItem but maybe with custom text/icon
-            # Fluent ListWidget generally handles text well
-            
-            item = QListWidgetItem(title)
-            item.setData(Qt.UserRole, sid)
-            
-            if is_pinned:
-                item.setIcon(FIF.PIN.icon())
+        lst = self.session_list
+        items = self._session_items
+
+        # One repaint and no selection signals for the whole update
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            live = {sess['id'] for sess in sessions}
+            for sid in [sid for sid in items if sid not in live]:
+                item, _ = items.pop(sid)
+                lst.takeItem(lst.row(item))
+
+            for idx, sess in enumerate(sessions):
+                sid = sess['id']
+                title = sess['title']
+                pinned = bool(sess.get('pinned', False))
+                entry = items.get(sid)
+                if entry is None:
+                    item = QListWidgetItem(title)
+                    item.setData(_SESSION_ID_ROLE, sid)
+                    item.setIcon(_session_icon(pinned))
+                    lst.insertItem(idx, item)
+                else:
+                    item, was_pinned = entry
+                    if item.text() != title:
+                        item.setText(title)
+                    if was_pinned != pinned:
+                        item.setIcon(_session_icon(pinned))
+                    if lst.item(idx) is not item:
+                        lst.takeItem(lst.row(item))
+                        lst.insertItem(idx, item)
+                items[sid] = (item, pinned)
+
+            current = items.get(current_session_id)
+            if current is not None:
+                lst.setCurrentItem(current[0])
             else:
-                item.setIcon(FIF.CHAT.icon())
-                
-            self.session_list.addItem(item)
-            if is_current:
-                self.session_list.setCurrentItem(item)
+                lst.setCurrentItem(None)
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
+
+    def _build_session_menu(self):
+        """Build the session context menu once; actions read _ctx_session_id."""
+        self._ctx_session_id = None
+        self._ctx_menu = RoundMenu(parent=self)
+        self._ctx_menu.addAction(Action(FIF.PIN, "Pin/Unpin", triggered=self._ctx_pin))
+        self._ctx_menu.addAction(Action(FIF.EDIT, "Rename", triggered=self._ctx_rename))
+        self._ctx_menu.addSeparator()
+        self._ctx_menu.addAction(Action(FIF.DELETE, "Delete", triggered=self._ctx_delete))
 
     def _show_session_context_menu(self, position):
         item = self.session_list.itemAt(position)
         if not item: return
-        session_id = item.data(Qt.UserRole)
+        session_id = item.data(_SESSION_ID_ROLE)
         if not session_id: return
 
-        menu = RoundMenu(parent=self)
-        
-        menu.addAction(Action(FIF.PIN, "Pin/Unpin", triggered=lambda: self.session_pin_requested.emit(session_id)))
-        menu.addAction(Action(FIF.EDIT, "Rename", triggered=lambda: self._prompt_rename(session_id)))
-        menu.addSeparator()
-        menu.addAction(Action(FIF.DELETE, "Delete", triggered=lambda: self.session_delete_requested.emit(session_id)))
-        
-        menu.exec(self.session_list.mapToGlobal(position))
+        self._ctx_session_id = session_id
+        self._ctx_menu.exec(self.session_list.mapToGlobal(position))
+
+    def _ctx_pin(self):
+        if self._ctx_session_id:
+            self.session_pin_requested.emit(self._ctx_session_id)
+
+    def _ctx_rename(self):
+        if self._ctx_session_id:
+            self._prompt_rename(self._ctx_session_id)
+
+    def _ctx_delete(self):
+        if self._ctx_session_id:
+            self.session_delete_requested.emit(self._ctx_session_id)
 
     def _prompt_rename(self, session_id):
         # We can implement a custom dialog later, for now standard input
-        from PySide6.QtWidgets import QInputDialog
         new_title, ok = QInputDialog.getText(self, "Rename Chat", "Enter new name:")
         if ok and new_title.strip():
             self.session_rename_requested.emit(session_id, new_title.strip())
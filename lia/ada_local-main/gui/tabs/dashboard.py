@@ -586,20 +586,20 @@ class PriorityCard(QFrame):
         """Update with the next upcoming event from the list."""
         now = datetime.now()
         next_event = None
+        next_start = None
         
         for event in events:
             try:
-                start_time = datetime.strptime(event['start_time'], "%Y-%m-%d %H:%M:%S")
-                if start_time > now:
-                    if next_event is None or start_time < datetime.strptime(next_event['start_time'], "%Y-%m-%d %H:%M:%S"):
-                        next_event = event
+                # 'YYYY-MM-DD HH:MM:SS' is ISO-8601 with a space; fromisoformat is the C fast path
+                start_time = datetime.fromisoformat(event['start_time'])
+                if start_time > now and (next_start is None or start_time < next_start):
+                    next_event, next_start = event, start_time
             except (KeyError, ValueError):
                 continue
         
         if next_event:
             self.title_label.setText(next_event['title'])
-            start_time = datetime.strptime(next_event['start_time'], "%Y-%m-%d %H:%M:%S")
-            delta = start_time - now
+            delta = next_start - now
             minutes = int(delta.total_seconds() / 60)
             if minutes < 60:
                 self.time_label.setText(f"Starts in {minutes} minutes")
@@ -1,11 +1,11 @@
 from PySide6.QtWidgets import (
     QFrame, QHBoxLayout, QVBoxLayout, QLabel, 
-    QListWidgetItem, QSizePolicy, QWidget, QScrollArea
+    QSizePolicy, QWidget, QScrollArea
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QModelIndex, QTimer, QObject, QRunnable, QThreadPool, Signal
 
 from qfluentwidgets import (
-    LineEdit, ListWidget, CheckBox, PushButton, 
+    LineEdit, PushButton, 
     TransparentToolButton, FluentIcon as FIF,
     CardWidget, HeaderCardWidget, BodyLabel, TitleLabel,
     StrongBodyLabel
@@ -14,9 +14,26 @@ from qfluentwidgets import (
 from gui.components.schedule import ScheduleComponent
 from gui.components.timer import TimerComponent
 from gui.components.alarm import AlarmComponent
+from gui.components.task_list import TaskListModel, TaskListView
 from core.tasks import task_manager
 
 
+class _TaskLoadSignals(QObject):
+    """Created on the GUI thread so `loaded` is delivered there."""
+    loaded = Signal(list)
+
+
+class _TaskLoader(QRunnable):
+    """Reads the task table on Qt's shared thread pool."""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = _TaskLoadSignals()
+    
+    def run(self):
+        self.signals.loaded.emit(task_manager.get_tasks())
+
+
 class PlannerTab(QFrame):
     """
     Planner functionality: Focus Tasks, Schedule, and Flow State tools.
@@ -29,9 +46,21 @@ class PlannerTab(QFrame):
         self.setStyleSheet("background: transparent;")
         
         self.completed_expanded = False
+        self._shown_completed_count = None  # last value written to completed_label
+        self._task_loaders = []  # in flight, oldest first; kept alive until they report back
+        
+        # Toggled rows repaint in place; moving them between lists is batched
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(100)
+        self._move_timer.timeout.connect(self._apply_pending_moves)
+        # Chevron SVGs rasterized once instead of on every expand/collapse
+        self._icon_collapsed = FIF.CHEVRON_RIGHT.icon()
+        self._icon_expanded = FIF.CHEVRON_DOWN_MED.icon()
         
         self._setup_ui()
-        self._load_tasks()
+        # Let the tab paint first; tasks fill in on the next event loop turn
+        QTimer.singleShot(0, self._load_tasks)
 
     def _setup_ui(self):
         planner_layout = QHBoxLayout(self)
@@ -66,14 +95,14 @@ class PlannerTab(QFrame):
         self.task_input.setClearButtonEnabled(True)
         t_layout.addWidget(self.task_input)
         
-        # Task Lists (Active)
-        self.task_list = ListWidget()
-        self.task_list.setStyleSheet("background: transparent; border: none;")
+        # Task Lists (Active) - rows are painted by TaskItemDelegate, no per-row widgets
+        self.task_model = TaskListModel(self)
+        self.task_list = self._create_task_view(self.task_model)
         t_layout.addWidget(self.task_list, 1) # Stretch to fill
         
         # Completed Section
         header_layout = QHBoxLayout()
-        self.completed_header_btn = TransparentToolButton(FIF.CHEVRON_RIGHT)
+        self.completed_header_btn = TransparentToolButton(self._icon_collapsed)
         self.completed_header_btn.clicked.connect(self._toggle_completed_section)
         header_layout.addWidget(self.completed_header_btn)
         
@@ -84,8 +113,8 @@ class PlannerTab(QFrame):
         
         t_layout.addLayout(header_layout)
         
-        self.completed_list = ListWidget()
-        self.completed_list.setStyleSheet("background: transparent; border: none;")
+        self.completed_model = TaskListModel(self)
+        self.completed_list = self._create_task_view(self.completed_model)
         self.completed_list.setVisible(False)
         t_layout.addWidget(self.completed_list)
         
@@ -133,13 +162,33 @@ class PlannerTab(QFrame):
         
         planner_layout.addWidget(flow_col)
 
+    def _create_task_view(self, model: TaskListModel) -> TaskListView:
+        view = TaskListView(model)
+        view.task_delegate.check_clicked.connect(self._on_task_checked)
+        view.task_delegate.delete_clicked.connect(self._delete_task)
+        return view
+
     def _load_tasks(self):
-        """Load tasks from persistent storage."""
-        tasks = task_manager.get_tasks()
-        self.task_list.clear()
-        self.completed_list.clear() # Fix duplication bug
+        """Load tasks from persistent storage (query runs off the GUI thread)."""
+        loader = _TaskLoader()
+        loader.setAutoDelete(False)
+        loader.signals.loaded.connect(self._on_tasks_loaded)
+        self._task_loaders.append(loader)
+        QThreadPool.globalInstance().start(loader)
+    
+    def _on_tasks_loaded(self, tasks: list):
+        """Fill both lists from a finished _TaskLoader."""
+        signals = self.sender()
+        loader = next(l for l in self._task_loaders if l.signals is signals)
+        latest = loader is self._task_loaders[-1]
+        self._task_loaders.remove(loader)
+        if not latest:
+            return  # superseded by a newer load
+        active, completed = [], []
         for task in tasks:
-            self._create_task_item(task)
+            (completed if task.get('completed') else active).append(self._task_row(task))
+        self.task_model.set_tasks(active)
+        self.completed_model.set_tasks(completed)
             
         self._update_task_counter()
         
@@ -156,99 +205,51 @@ class PlannerTab(QFrame):
         # Save to DB
         new_task = task_manager.add_task(task_text)
         if new_task:
-            self._create_task_item(new_task)
+            self._model_for(new_task.get('completed', False)).append_task(self._task_row(new_task))
         self._update_task_counter()
+
+    @staticmethod
+    def _task_row(task_data: dict) -> dict:
+        return {
+            "id": task_data.get('id'),
+            "text": task_data.get('text', ''),
+            "completed": bool(task_data.get('completed', False)),
+        }
+
+    def _model_for(self, completed: bool) -> TaskListModel:
+        return self.completed_model if completed else self.task_model
     
-    def _on_task_checked(self, state: int, item: QListWidgetItem, source_list: ListWidget):
-        """Handle task checkbox state change - move between lists."""
-        widget = source_list.itemWidget(item)
-        if not widget:
-            return
-            
-        # Get task ID from data
-        task_id = item.data(Qt.UserRole)
-        
-        # Get task text from label
-        # We need to find the BodyLabel inside
-        label = widget.findChild(BodyLabel)
-        if not label:
-            # Fallback if using QLabel
-            label = widget.findChild(QLabel)
-            
-        if not label:
-            return
-        
-        task_text = label.text()
-        row = source_list.row(item)
-        is_completed = (state == Qt.Checked.value)
+    def _on_task_checked(self, index: QModelIndex):
+        """Handle task checkbox click - restyle now, move between lists shortly after."""
+        source = index.model()
+        task = source.task_at(index.row())
+        is_completed = not task['completed']
         
         # Update persistence
-        task_manager.toggle_task(task_id, is_completed)
+        task_manager.toggle_task(task['id'], is_completed)
         
-        # Start transition
-        source_list.takeItem(row)
-        
-        # Re-create in correct list
-        task_data = {"id": task_id, "text": task_text, "completed": is_completed}
-        self._create_task_item(task_data)
-        
-        self._update_task_counter()
+        source.set_completed(index.row(), is_completed)
+        self._move_timer.start()
     
-    def _create_task_item(self, task_data: dict):
-        """Create a task item widget and add to appropriate list."""
-        completed = task_data.get('completed', False)
-        text = task_data.get('text', '')
-        task_id = task_data.get('id')
-        
-        target_list = self.completed_list if completed else self.task_list
-        
-        item = QListWidgetItem()
-        item.setSizeHint(QSize(0, 50))
-        item.setData(Qt.UserRole, task_id)  # Store ID
-        
-        task_widget = QWidget()
-        task_layout = QHBoxLayout(task_widget)
-        task_layout.setContentsMargins(10, 5, 10, 5)
-        task_layout.setSpacing(12)
-        
-        # Checkbox
-        checkbox = CheckBox()
-        checkbox.setChecked(completed)
-        # Fix lambda binding
-        checkbox.stateChanged.connect(lambda state, i=item, l=target_list: self._on_task_checked(state, i, l))
-        task_layout.addWidget(checkbox)
-        
-        # Task label
-        task_label = BodyLabel(text)
-        if completed:
-            # Strikethrough style
-            task_label.setStyleSheet("color: #8a8a8a; text-decoration: line-through;")
-        else:
-            task_label.setStyleSheet("color: #e8eaed;") 
-            
-        task_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        task_layout.addWidget(task_label, 1)
-        
-        # Delete button
-        delete_btn = TransparentToolButton(FIF.DELETE)
-        delete_btn.clicked.connect(lambda: self._delete_task(item, target_list))
-        task_layout.addWidget(delete_btn)
+    def _apply_pending_moves(self):
+        """Move every row whose state no longer matches its list (one batch per burst of clicks)."""
+        done = self.task_model.take_where_completed(True)
+        undone = self.completed_model.take_where_completed(False)
+        for task in done:
+            self.completed_model.append_task(task)
+        for task in undone:
+            self.task_model.append_task(task)
         
-        target_list.addItem(item)
-        target_list.setItemWidget(item, task_widget)
+        self._update_task_counter()
     
-    def _delete_task(self, item: QListWidgetItem, source_list: ListWidget = None):
+    def _delete_task(self, index: QModelIndex):
         """Delete a task from the list."""
-        if source_list is None:
-            source_list = self.task_list
-            
-        task_id = item.data(Qt.UserRole)
-        task_manager.delete_task(task_id)
+        source = index.model()
+        task = source.task_at(index.row())
+        task_manager.delete_task(task['id'])
         
-        row = source_list.row(item)
-        if row >= 0:
-            source_list.takeItem(row)
-            self._update_task_counter()
+        source.remove_row(index.row())
+        self._update_task_counter()
     
     def _toggle_completed_section(self):
         """Toggle the completed tasks section visibility."""
@@ -256,11 +257,14 @@ class PlannerTab(QFrame):
         self.completed_list.setVisible(self.completed_expanded)
         
         if self.completed_expanded:
-            self.completed_header_btn.setIcon(FIF.CHEVRON_DOWN_MED)
+            self.completed_header_btn.setIcon(self._icon_expanded)
         else:
-            self.completed_header_btn.setIcon(FIF.CHEVRON_RIGHT)
+            self.completed_header_btn.setIcon(self._icon_collapsed)
     
     def _update_task_counter(self):
         """Update the task counter label and completed header."""
-        completed_count = self.completed_list.count()
-        self.completed_label.setText(f"Completed {completed_count}")
+        completed_count = self.completed_model.rowCount()
+        # Skip the label relayout when adding/deleting active tasks leaves it unchanged
+        if completed_count != self._shown_completed_count:
+            self._shown_completed_count = completed_count
+            self.completed_label.setText(f"Completed {completed_count}")
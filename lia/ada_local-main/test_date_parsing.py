@@ -1,32 +1,52 @@
-from datetime import datetime, timedelta
+import re
+from datetime import date, datetime, timedelta
+
+# Day name -> weekday() index, matched in one regex pass
+_DOW = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6,
+}
+_DOW_RE = re.compile(f"({'|'.join(_DOW)})")
+_ONE_DAY = timedelta(days=1)
 
 def _parse_date(date_str: str) -> str:
     """Parse date string to YYYY-MM-DD format."""
     print(f"Parsing: '{date_str}'")
     date_str = date_str.lower().strip()
-    today = datetime.now()
+    
+    # Explicit YYYY-MM-DD
+    if len(date_str) == 10 and date_str[4] == '-':
+        try:
+            datetime.strptime(date_str, "%Y-%m-%d")
+            return date_str
+        except ValueError:
+            pass
+    
+    # isoformat() is plain C, no locale-aware strftime
+    today = date.today()
+    today_str = today.isoformat()
     
     if date_str in ("today", ""):
-        return today.strftime("%Y-%m-%d")
+        return today_str
     elif date_str == "tomorrow":
-        return (today + timedelta(days=1)).strftime("%Y-%m-%d")
+        return (today + _ONE_DAY).isoformat()
     
     # Day names
-    days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-    for i, day in enumerate(days):
-        if day in date_str:
-            current_day = today.weekday()
-            days_ahead = i - current_day
-            if days_ahead <= 0:
-                days_ahead += 7
-            if "next" in date_str:
-                days_ahead += 7
-            target = today + timedelta(days=days_ahead)
-            return target.strftime("%Y-%m-%d")
+    match = _DOW_RE.search(date_str)
+    if match:
+        # Pure int math: ordinal 1 (0001-01-01) is a Monday
+        ordinal = today.toordinal()
+        days_ahead = _DOW[match.group(1)] - (ordinal - 1) % 7
+        if days_ahead <= 0:
+            days_ahead += 7
+        if "next" in date_str:
+            days_ahead += 7
+        return date.fromordinal(ordinal + days_ahead).isoformat()
     
-    return today.strftime("%Y-%m-%d")
+    return today_str
 
 # Tests
 print(f"Today: {_parse_date('today')}")
 print(f"Tomorrow: {_parse_date('tomorrow')}")
-print(f"Explicit Date (Should fail in current impl): {_parse_date('2025-12-25')}")
+print(f"Explicit Date: {_parse_date('2025-12-25')}")
+print(f"Next Friday: {_parse_date('next friday')}")
@@ -0,0 +1,108 @@
+import sys
+import os
+import sqlite3
+import unittest
+
+# Add core directory to path to bypass package init (avoids loading tts/sounddevice)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../core')))
+
+from calendar_manager import CalendarManager
+
+TEST_DB = "data/test_calendar.db"
+
+class TestCalendarManager(unittest.TestCase):
+    def setUp(self):
+        self._remove_db()
+        self.mgr = CalendarManager(db_path=TEST_DB)
+
+    def tearDown(self):
+        self.mgr.close()
+        self._remove_db()
+
+    def _remove_db(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(TEST_DB + suffix):
+                os.remove(TEST_DB + suffix)
+
+    def test_add_and_get_events(self):
+        self.mgr.add_event("Standup", "2025-03-10 09:00:00", "2025-03-10 09:15:00")
+        self.mgr.add_event("Lunch", "2025-03-10 12:00:00", "2025-03-10 13:00:00", "PERSONAL")
+        self.mgr.add_event("Tomorrow", "2025-03-11 09:00:00", "2025-03-11 10:00:00")
+
+        events = self.mgr.get_events("2025-03-10")
+        self.assertEqual([e['title'] for e in events], ["Standup", "Lunch"])
+        self.assertEqual(events[0]['start_time'], "2025-03-10 09:00:00")
+        self.assertEqual(events[1]['end_time'], "2025-03-10 13:00:00")
+        self.assertEqual(events[1]['category'], "PERSONAL")
+        self.assertEqual(events[0]['_time_str'], "9:00 AM")
+        self.assertEqual(events[1]['_time_str'], "12:00 PM")
+
+    def test_day_boundaries(self):
+        self.mgr.add_event("Midnight", "2025-03-10 00:00:00", "2025-03-10 00:30:00")
+        self.mgr.add_event("Late", "2025-03-10 23:59:59", "2025-03-11 00:30:00")
+        self.mgr.add_event("Next Day", "2025-03-11 00:00:00", "2025-03-11 00:30:00")
+
+        titles = [e['title'] for e in self.mgr.get_events("2025-03-10")]
+        self.assertEqual(titles, ["Midnight", "Late"])
+
+    def test_add_events_bulk(self):
+        created = self.mgr.add_events_bulk([
+            ("A", "2025-03-10 08:00:00", "2025-03-10 09:00:00"),
+            ("B", "2025-03-10 10:00:00", "2025-03-10 11:00:00", "PERSONAL", "notes"),
+        ])
+        self.assertEqual(len(created), 2)
+        self.assertNotEqual(created[0]['id'], created[1]['id'])
+
+        events = self.mgr.get_events("2025-03-10")
+        self.assertEqual([e['title'] for e in events], ["A", "B"])
+        self.assertEqual(events[1]['description'], "notes")
+
+    def test_add_events_bulk_rejects_invalid_batch(self):
+        created = self.mgr.add_events_bulk([
+            ("Good", "2025-03-10 08:00:00", "2025-03-10 09:00:00"),
+            ("Bad", "not a time", "2025-03-10 11:00:00"),
+        ])
+        self.assertEqual(created, [])
+        self.assertEqual(self.mgr.get_events("2025-03-10"), [])
+
+    def test_delete_event(self):
+        event = self.mgr.add_event("Gone", "2025-03-10 09:00:00", "2025-03-10 10:00:00")
+        self.mgr.delete_event(event['id'])
+        self.assertEqual(self.mgr.get_events("2025-03-10"), [])
+
+    def test_migrates_text_timestamps(self):
+        self.mgr.close()
+        self._remove_db()
+
+        conn = sqlite3.connect(TEST_DB)
+        conn.execute("""
+            CREATE TABLE events (
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                start_time TIMESTAMP NOT NULL,
+                end_time TIMESTAMP NOT NULL,
+                category TEXT DEFAULT 'WORK',
+                description TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "INSERT INTO events (id, title, start_time, end_time) VALUES (?, ?, ?, ?)",
+            ("legacy", "Old Event", "2025-03-10 15:30:00", "2025-03-10 16:30:00")
+        )
+        conn.commit()
+        conn.close()
+
+        self.mgr = CalendarManager(db_path=TEST_DB)
+        events = self.mgr.get_events("2025-03-10")
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['id'], "legacy")
+        self.assertEqual(events[0]['start_time'], "2025-03-10 15:30:00")
+
+        conn = sqlite3.connect(TEST_DB)
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name='events'").fetchone()[0]
+        conn.close()
+        self.assertIn("WITHOUT ROWID", sql)
+
+if __name__ == '__main__':
+    unittest.main()
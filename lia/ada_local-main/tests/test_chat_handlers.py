@@ -0,0 +1,108 @@
+import sys
+import os
+import unittest
+import types
+
+# Repo root on the path so the gui/core packages import as the app does
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout
+    from gui.app import MainWindow
+    from gui.handlers import ChatHandlers
+    HAS_GUI = True
+except ImportError:
+    HAS_GUI = False
+
+
+if HAS_GUI:
+    class FakeChatTab:
+        """Stands in for ChatTab: promotes a row's widgets into its layout."""
+
+        def __init__(self, row_layout, thinking_ui, search_indicator):
+            self.row_layout = row_layout
+            self.unpromoted = [thinking_ui, search_indicator]
+            self.calls = []
+
+        def promote_thinking(self, response_bubble):
+            self.calls.append(("thinking", response_bubble))
+            self.row_layout.insertWidget(0, self.unpromoted[0])
+
+        def promote_search(self, response_bubble):
+            self.calls.append(("search", response_bubble))
+            self.row_layout.insertWidget(self.row_layout.indexOf(response_bubble), self.unpromoted[1])
+
+    class FakeSearchIndicator(QWidget):
+        def __init__(self):
+            super().__init__()
+            self.queries = []
+
+        def add_query(self, query):
+            self.queries.append(query)
+
+    class FakeMainWindow(QWidget):
+        # The real forwarders under test; everything else the handlers need is faked
+        promote_thinking = MainWindow.promote_thinking
+        promote_search = MainWindow.promote_search
+
+        def __init__(self):
+            super().__init__()
+            self.chat_lazy = types.SimpleNamespace(actual_widget=None)
+
+
+@unittest.skipUnless(HAS_GUI, "GUI dependencies not installed")
+class TestChatHandlersPromotion(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.window = FakeMainWindow()
+        row_layout = QVBoxLayout(self.window)
+        self.response_bubble = QWidget()
+        row_layout.addWidget(self.response_bubble)
+        self.thinking_ui = QWidget()
+        self.search_indicator = FakeSearchIndicator()
+        self.thinking_ui.setVisible(False)
+        self.search_indicator.setVisible(False)
+        self.chat = FakeChatTab(row_layout, self.thinking_ui, self.search_indicator)
+        self.window.chat_lazy.actual_widget = self.chat
+
+        self.handlers = ChatHandlers(self.window)
+        self.handlers.streaming_state.update(
+            response_bubble=self.response_bubble,
+            thinking_ui=self.thinking_ui,
+            search_indicator=self.search_indicator,
+        )
+        self.window.show()
+
+    def tearDown(self):
+        self.handlers.ui_throttle_timer.stop()
+        self.window.close()
+
+    def test_think_start_promotes_and_shows(self):
+        self.handlers._on_think_start(True)
+        self.assertEqual(self.chat.calls, [("thinking", self.response_bubble)])
+        self.assertIs(self.thinking_ui.parentWidget(), self.window)
+        self.assertTrue(self.thinking_ui.isVisible())
+
+    def test_search_start_promotes_and_shows(self):
+        self.handlers._on_search_start("weather")
+        self.assertEqual(self.chat.calls, [("search", self.response_bubble)])
+        self.assertEqual(self.search_indicator.queries, ["weather"])
+        self.assertIs(self.search_indicator.parentWidget(), self.window)
+        self.assertTrue(self.search_indicator.isVisible())
+
+    def test_no_chat_tab_keeps_widgets_hidden(self):
+        # Without a row to join, showing them would open top-level windows
+        self.window.chat_lazy.actual_widget = None
+        self.handlers._on_think_start(True)
+        self.handlers._on_search_start("weather")
+        self.assertIsNone(self.thinking_ui.parentWidget())
+        self.assertFalse(self.thinking_ui.isVisible())
+        self.assertFalse(self.search_indicator.isVisible())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock
 
 # MOCK EVERYTHING from core to prevent __init__.py from loading unwanted modules
 sys.modules["core.router"] = MagicMock()
@@ -29,11 +29,9 @@ def run_sync_test():
         "192.168.1.12": {"alias": "Kitchen Light", "is_on": True}
     }
     
-    # Need to return an awaitable for run_until_complete
-    async def mock_turn_off_action(ip):
-        return True
-    
-    mock_kasa.turn_off.side_effect = mock_turn_off_action
+    # Awaitable mocks for the async KasaManager API
+    mock_kasa.turn_off = AsyncMock(return_value=True)
+    mock_kasa.turn_on = AsyncMock(return_value=True)
     
     executor.kasa_manager = mock_kasa
     
@@ -56,9 +54,7 @@ def run_sync_test():
             success = False
 
     # Test Color
-    async def mock_set_hsv_action(ip, h, s, v):
-        return True
-    mock_kasa.set_hsv.side_effect = mock_set_hsv_action
+    mock_kasa.set_hsv = AsyncMock(return_value=True)
 
     print("\nCommand: 'turn office blue'")
     result_color = executor._control_light({"action": "color", "device_name": "office", "color": "blue"})
@@ -0,0 +1,73 @@
+import sys
+import os
+import unittest
+import importlib.util
+
+# Add components directory to path to bypass package init (avoids loading markdown/pygments)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../gui/components')))
+
+HAS_QT = all(importlib.util.find_spec(m) for m in ("PySide6", "qfluentwidgets"))
+
+if HAS_QT:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt, QPoint
+    from PySide6.QtTest import QTest
+    from task_list import TaskListModel, TaskListView, TaskItemDelegate
+
+
+@unittest.skipUnless(HAS_QT, "PySide6/qfluentwidgets not installed")
+class TestTaskListView(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        # Exceptions raised inside Qt virtuals/slots are only printed; collect them instead
+        self.errors = []
+        self._old_hook = sys.excepthook
+        sys.excepthook = lambda *exc: self.errors.append(exc[1])
+        self.model = TaskListModel()
+        self.model.set_tasks([
+            {"id": "a", "text": "First", "completed": False},
+            {"id": "b", "text": "Second", "completed": True},
+        ])
+        self.view = TaskListView(self.model)
+        self.view.resize(300, 200)
+        self.view.show()
+        QTest.qWaitForWindowExposed(self.view)
+        self.checked, self.deleted = [], []
+        self.view.task_delegate.check_clicked.connect(lambda i: self.checked.append(i.row()))
+        self.view.task_delegate.delete_clicked.connect(lambda i: self.deleted.append(i.row()))
+
+    def tearDown(self):
+        self.view.close()
+        sys.excepthook = self._old_hook
+        self.assertEqual(self.errors, [])
+
+    def _row_point(self, row: int, x: int):
+        rect = self.view.visualRect(self.model.index(row))
+        return QPoint(rect.left() + x if x >= 0 else rect.right() + x, rect.center().y())
+
+    def test_hover_and_leave_rows(self):
+        vp = self.view.viewport()
+        QTest.mouseMove(vp, self._row_point(0, 100))
+        QTest.mouseMove(vp, self._row_point(1, 100))
+        QTest.mouseMove(vp, QPoint(150, 190))
+        self.view.update()
+        QTest.qWait(10)
+
+    def test_click_checkbox_and_delete(self):
+        vp = self.view.viewport()
+        check_x = TaskItemDelegate.MARGIN + TaskItemDelegate.CHECK_SIZE // 2
+        delete_x = -(TaskItemDelegate.MARGIN + TaskItemDelegate.DELETE_SIZE // 2)
+        QTest.mouseClick(vp, Qt.LeftButton, Qt.NoModifier, self._row_point(0, check_x))
+        QTest.mouseClick(vp, Qt.LeftButton, Qt.NoModifier, self._row_point(1, delete_x))
+        # Clicking the text area is not a checkbox/delete hit
+        QTest.mouseClick(vp, Qt.LeftButton, Qt.NoModifier, self._row_point(0, 100))
+        self.assertEqual(self.checked, [0])
+        self.assertEqual(self.deleted, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
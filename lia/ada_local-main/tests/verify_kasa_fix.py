@@ -2,7 +2,7 @@
 import sys
 import os
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock
 
 # Add project root to path
 sys.path.append(os.getcwd())
@@ -21,24 +21,7 @@ sys.modules["core.kasa_control"] = MagicMock()
 
 from core.function_executor import FunctionExecutor
 
-async def mock_discover():
-    print("Mock discovery called")
-    devices = {"192.168.1.100": {"alias": "Office Light", "ip": "192.168.1.100"}}
-    # Side effect: update the manager's devices
-    executor.kasa_manager.devices = devices
-    return devices
-
-async def mock_turn_on(ip):
-    print(f"Mock turn_on called for {ip}")
-    return True
-
-async def mock_turn_off(ip):
-    print(f"Mock turn_off called for {ip}")
-    return True
-
-async def mock_set_hsv(ip, h, s, v):
-    print(f"Mock set_hsv called for {ip}: {h},{s},{v}")
-    return True
+OFFICE_DEVICES = {"192.168.1.100": {"alias": "Office Light", "ip": "192.168.1.100"}}
 
 def test_light_control_loop():
     print("Testing light control loop management...")
@@ -46,20 +29,28 @@ def test_light_control_loop():
     executor = FunctionExecutor()
     
     # Mock KasaManager instance
-    executor.kasa_manager = MagicMock()
-    executor.kasa_manager.devices = {} # Start empty
-    executor.kasa_manager.discover_devices = mock_discover
-    executor.kasa_manager.turn_on = mock_turn_on
-    executor.kasa_manager.turn_off = mock_turn_off
-    executor.kasa_manager.set_hsv = mock_set_hsv
+    kasa = executor.kasa_manager = MagicMock()
+    kasa.devices = {} # Start empty
+    
+    def discover():
+        # Side effect: update the manager's devices
+        print("Mock discovery called")
+        kasa.devices = dict(OFFICE_DEVICES)
+        return kasa.devices
+    
+    kasa.discover_devices = AsyncMock(side_effect=discover)
+    kasa.turn_on = AsyncMock(return_value=True)
+    kasa.turn_off = AsyncMock(return_value=True)
+    kasa.set_hsv = AsyncMock(return_value=True)
     executor.kasa_manager._get_light_module = MagicMock(return_value=(MagicMock(is_on=True), None))
     
     print("\n--- Call 1: Turn On (Trigger Discovery) ---")
     res1 = executor.execute("control_light", {"action": "on", "device_name": "office"})
     print(f"Result 1: {res1}")
+    first_loop = executor._loop
     
     # Populate cache to simulate successful discovery
-    executor.kasa_manager.devices = {"192.168.1.100": {"alias": "Office Light", "ip": "192.168.1.100"}}
+    kasa.devices = dict(OFFICE_DEVICES)
     
     print("\n--- Call 2: Turn Off (Use Cache) ---")
     res2 = executor.execute("control_light", {"action": "off", "device_name": "office"})
@@ -69,7 +60,11 @@ def test_light_control_loop():
     res3 = executor.execute("control_light", {"action": "on", "color": "blue", "device_name": "office"})
     print(f"Result 3: {res3}")
     
-    if res1['success'] and res2['success'] and res3['success']:
+    # All calls must run on the executor's one persistent loop, not a loop per call
+    same_loop = first_loop is not None and executor._loop is first_loop and first_loop.is_running()
+    print(f"Shared event loop across calls: {same_loop}")
+    
+    if res1['success'] and res2['success'] and res3['success'] and same_loop:
         print("\nSUCCESS: Multiple calls executed without event loop error.")
     else:
         print("\nFAILURE: One or more calls failed.")
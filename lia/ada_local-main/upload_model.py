@@ -6,9 +6,49 @@ Usage:
     2. Run: python upload_model.py
 """
 
-from huggingface_hub import HfApi, create_repo
 from config import LOCAL_ROUTER_PATH, HF_ROUTER_REPO
 import os
+import glob
+import hashlib
+from fnmatch import fnmatch
+
+# Model weights/config/tokenizer only; skips checkpoints and stray temp files.
+# transformers>=4.57 saves the chat template as chat_template.jinja, which the
+# router needs for apply_chat_template; *.md keeps the model card.
+UPLOAD_PATTERNS = ["*.safetensors", "*.json", "*.txt", "*.jinja", "*.model", "*.md", "tokenizer*"]
+
+def _file_digest(path: str, lfs: bool) -> str:
+    """sha256 for LFS files, git blob sha1 otherwise (what the Hub reports for each)."""
+    h = hashlib.sha256() if lfs else hashlib.sha1(b"blob %d\0" % os.path.getsize(path))
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _changed_files(api, folder: str) -> list:
+    """Relative paths under `folder` whose content differs from the Hub copy."""
+    try:
+        info = api.model_info(HF_ROUTER_REPO, files_metadata=True)
+        remote = {s.rfilename: s for s in info.siblings}
+    except Exception as e:
+        print(f"Could not read remote file list ({e}), uploading everything")
+        remote = {}
+    
+    changed = []
+    for root, _, files in os.walk(folder):
+        for name in files:
+            abs_path = os.path.join(root, name)
+            rel = os.path.relpath(abs_path, folder).replace(os.sep, "/")
+            if not any(fnmatch(rel, pat) for pat in UPLOAD_PATTERNS):
+                continue
+            sibling = remote.get(rel)
+            if sibling is not None:
+                if sibling.lfs is not None and _file_digest(abs_path, lfs=True) == sibling.lfs.sha256:
+                    continue
+                if sibling.lfs is None and _file_digest(abs_path, lfs=False) == sibling.blob_id:
+                    continue
+            changed.append(rel)
+    return changed
 
 def upload_model():
     """Upload the merged model to Hugging Face Hub."""
@@ -18,6 +58,9 @@ def upload_model():
         print("Train the model first using: python train_function_gemma.py")
         return
     
+    # Imported only once there is something to upload (hub pulls in requests, tqdm, filelock...)
+    from huggingface_hub import HfApi, create_repo
+    
     api = HfApi()
     
     # Create repo if it doesn't exist
@@ -27,14 +70,22 @@ def upload_model():
     except Exception as e:
         print(f"Repo creation note: {e}")
     
-    # Upload all files from merged_model folder
-    print(f"Uploading model from {LOCAL_ROUTER_PATH}...")
+    # Only push files whose content hash differs from what is already on the Hub
+    changed = _changed_files(api, LOCAL_ROUTER_PATH)
+    if not changed:
+        print("✓ Hub copy is already up to date, nothing to upload")
+        return
+    print(f"Uploading {len(changed)} changed file(s) from {LOCAL_ROUTER_PATH}...")
     
-    api.upload_folder(
+    # upload_large_folder splits the shards across workers and commits in
+    # chunks, and resumes from its local cache if a run is interrupted
+    api.upload_large_folder(
         folder_path=LOCAL_ROUTER_PATH,
         repo_id=HF_ROUTER_REPO,
         repo_type="model",
-        commit_message="Upload FunctionGemma router model"
+        # Exact paths, escaped so names with [ ] * ? aren't read as wildcards
+        allow_patterns=[glob.escape(p) for p in changed],
+        num_workers=8
     )
     
     print(f"\n✓ Model uploaded successfully!")